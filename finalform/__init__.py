@@ -1,8 +1,45 @@
 """finalform: Semantic processing engine for psychological instruments."""
 
+import os
+
 __version__ = "0.1.0"
 
 # Import callable protocol - these imports must come after __version__ to avoid circular import
 from finalform.callable import CallableResult, execute
 
 __all__ = ["__version__", "CallableResult", "execute"]
+
+
+def _load_registries() -> None:
+    """Read every spec file under the configured registries.
+
+    Pulls the registry JSON into the OS page cache on a background
+    thread so the first Pipeline build doesn't stall on cold disk
+    reads. Best-effort: missing or unreadable registries are ignored.
+    """
+    from finalform.config import get_binding_registry_path, get_measure_registry_path
+
+    for root in (get_measure_registry_path(), get_binding_registry_path()):
+        try:
+            for path in root.rglob("*.json"):
+                try:
+                    path.read_bytes()
+                except OSError:
+                    continue
+        except OSError:
+            continue
+
+
+def _prewarm() -> None:
+    """Start the registry prewarm thread when FINALFORM_PREWARM=1.
+
+    Off by default: library importers shouldn't pay for speculative I/O,
+    and the CLI resolves registries explicitly per command.
+    """
+    import threading
+
+    threading.Thread(target=_load_registries, daemon=True).start()
+
+
+if os.environ.get("FINALFORM_PREWARM") == "1":
+    _prewarm()
@@ -5,10 +5,13 @@ These are JSON-serializable Pydantic models - actual event emission is
 handled downstream by lorchestra.
 """
 
+import hashlib
+import sys
 import uuid
 from datetime import datetime, timezone
 from typing import Literal
 
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
 
 from finalform import __version__
@@ -18,8 +21,21 @@ from finalform.registry.models import FormBindingSpec
 from finalform.scoring.engine import ScoringResult
 
 
+# Interned values for the hot Observation literal fields, so every instance
+# in a batch shares one string object per distinct value.
+_KIND_ITEM = sys.intern("item")
+_KIND_SCALE = sys.intern("scale")
+_VT_INTEGER = sys.intern("integer")
+_VT_FLOAT = sys.intern("float")
+_VT_STRING = sys.intern("string")
+_VT_NULL = sys.intern("null")
+
+
 class Source(BaseModel):
-    """Source information for a measurement event."""
+    """Source information for a measurement event.
+
+    Frozen so one instance can be safely shared by all events of a form.
+    """
 
     form_id: str
     form_submission_id: str
@@ -27,6 +43,8 @@ class Source(BaseModel):
     binding_id: str
     binding_version: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Telemetry(BaseModel):
     """Processing provenance for a measurement event."""
@@ -71,6 +89,42 @@ class MeasurementEvent(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to aliased JSON bytes directly from attributes.
+
+        Equivalent to ``orjson.dumps(model_dump(by_alias=True))`` but
+        assembles the payload without pydantic's dump machinery — all
+        fields are plain Python values, so the dict walk is redundant.
+        """
+        return orjson.dumps(
+            {
+                "schema": self.schema_,
+                "measurement_event_id": self.measurement_event_id,
+                "measure_id": self.measure_id,
+                "measure_version": self.measure_version,
+                "subject_id": self.subject_id,
+                "timestamp": self.timestamp,
+                "source": self.source.__dict__,
+                "observations": [
+                    {
+                        "schema": o.schema_,
+                        "observation_id": o.observation_id,
+                        "measure_id": o.measure_id,
+                        "code": o.code,
+                        "kind": o.kind,
+                        "value": o.value,
+                        "value_type": o.value_type,
+                        "label": o.label,
+                        "raw_answer": o.raw_answer,
+                        "position": o.position,
+                        "missing": o.missing,
+                    }
+                    for o in self.observations
+                ],
+                "telemetry": self.telemetry.__dict__,
+            }
+        )
+
 
 class MeasurementEventBuilder:
     """Builds MeasurementEvent JSON structures from processed data.
@@ -79,6 +133,18 @@ class MeasurementEventBuilder:
     MeasurementEvent with embedded Observations.
     """
 
+    # UUIDv5 namespace for deterministic IDs, parsed once at class creation
+    _NAMESPACE_BYTES = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8").bytes
+
+    # Exact-type dispatch for _get_value_type; floats are handled separately
+    # because whole-number floats are reported as "integer".
+    _VALUE_TYPES: dict[type, Literal["integer", "float", "string", "null"]] = {
+        type(None): _VT_NULL,
+        bool: _VT_INTEGER,  # Treat bools as int
+        int: _VT_INTEGER,
+        str: _VT_STRING,
+    }
+
     def __init__(self, deterministic_ids: bool = False) -> None:
         """Initialize the builder.
 
@@ -88,16 +154,46 @@ class MeasurementEventBuilder:
         """
         self.deterministic_ids = deterministic_ids
         self._id_counter = 0
-
-    def _generate_id(self, seed: str = "") -> str:
-        """Generate a UUID for an event or observation."""
+        # build() primes a SHA-1 over namespace+seed so per-observation IDs
+        # only hash the suffix
+        self._seed_hash: "hashlib._Hash | None" = None
+        # "<id>@<version>" telemetry strings, keyed by (id, version); specs
+        # vary slowly across build() calls so the f-string work is memoized.
+        self._spec_str_cache: dict[tuple[str, str], str] = {}
+        # processed_at is informational; sample the clock once per builder
+        # (one builder per form response) instead of once per event
+        self._processed_at: str | None = None
+        # Source is identical for every event of a form; build it once and
+        # share the (frozen) instance across events
+        self._source: Source | None = None
+        self._source_key: tuple | None = None
+
+    def _spec_str(self, spec_id: str, version: str) -> str:
+        """Return the cached "<id>@<version>" string for a spec."""
+        key = (spec_id, version)
+        spec_str = self._spec_str_cache.get(key)
+        if spec_str is None:
+            spec_str = f"{spec_id}@{version}"
+            self._spec_str_cache[key] = spec_str
+        return spec_str
+
+    def _generate_id(self, suffix: bytes = b"") -> str:
+        """Generate a UUID for an event or observation.
+
+        In deterministic mode, produces a UUIDv5 over the per-event seed
+        (pre-hashed in build()) plus the given byte suffix and a counter.
+        Otherwise formats a random UUID4 without the str() round-trip.
+        """
         if self.deterministic_ids:
-            # Use a deterministic UUID based on seed and counter
             self._id_counter += 1
-            namespace = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
-            return str(uuid.uuid5(namespace, f"{seed}:{self._id_counter}"))
+            assert self._seed_hash is not None
+            digest = self._seed_hash.copy()
+            digest.update(suffix)
+            digest.update(b":%d" % self._id_counter)
+            return str(uuid.UUID(bytes=digest.digest()[:16], version=5))
         else:
-            return str(uuid.uuid4())
+            h = uuid.uuid4().hex
+            return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
     def build(
         self,
@@ -131,39 +227,53 @@ class MeasurementEventBuilder:
         """
         seed = f"{form_submission_id}:{recoded_section.measure_id}"
 
-        # Build observations for items
-        item_observations = self._build_item_observations(recoded_section, seed)
-
-        # Build observations for scales
-        scale_observations = self._build_scale_observations(
-            scoring_result, interpretation_result, seed
-        )
-
-        # Combine all observations
-        observations = item_observations + scale_observations
+        # Prime the seed hash once per event; _generate_id only hashes suffixes
+        if self.deterministic_ids:
+            self._seed_hash = hashlib.sha1(self._NAMESPACE_BYTES + seed.encode())
 
-        # Build source
-        source = Source(
-            form_id=form_id,
-            form_submission_id=form_submission_id,
-            form_correlation_id=form_correlation_id,
-            binding_id=binding_spec.binding_id,
-            binding_version=binding_spec.version,
+        # Build observations for items
+        # Item and scale observations are appended into one shared list to
+        # avoid the extra allocation and copy of concatenating two lists
+        observations: list[Observation] = []
+        self._append_item_observations(recoded_section, observations)
+        self._append_scale_observations(scoring_result, interpretation_result, observations)
+
+        # Build source (model_construct: inputs are already-typed Python
+        # objects from upstream stages, so pydantic validation is redundant);
+        # reuse the previous instance when the form-level fields match
+        source_key = (
+            form_id,
+            form_submission_id,
+            form_correlation_id,
+            binding_spec.binding_id,
+            binding_spec.version,
         )
+        if self._source is None or self._source_key != source_key:
+            self._source = Source.model_construct(
+                form_id=form_id,
+                form_submission_id=form_submission_id,
+                form_correlation_id=form_correlation_id,
+                binding_id=binding_spec.binding_id,
+                binding_version=binding_spec.version,
+            )
+            self._source_key = source_key
+        source = self._source
 
         # Build telemetry
-        telemetry = Telemetry(
-            processed_at=datetime.now(timezone.utc).isoformat(),
+        processed_at = self._processed_at
+        if processed_at is None:
+            processed_at = self._processed_at = datetime.now(timezone.utc).isoformat()
+        telemetry = Telemetry.model_construct(
+            processed_at=processed_at,
             final_form_version=__version__,
-            measure_spec=f"{recoded_section.measure_id}@{recoded_section.measure_version}",
-            form_binding_spec=f"{binding_spec.binding_id}@{binding_spec.version}",
+            measure_spec=self._spec_str(recoded_section.measure_id, recoded_section.measure_version),
+            form_binding_spec=self._spec_str(binding_spec.binding_id, binding_spec.version),
             warnings=warnings or [],
         )
 
         # Build the event
-        return MeasurementEvent(
-            schema="com.lifeos.measurement_event.v1",
-            measurement_event_id=self._generate_id(seed),
+        return MeasurementEvent.model_construct(
+            measurement_event_id=self._generate_id(),
             measure_id=recoded_section.measure_id,
             measure_version=recoded_section.measure_version,
             subject_id=subject_id,
@@ -173,23 +283,24 @@ class MeasurementEventBuilder:
             telemetry=telemetry,
         )
 
-    def _build_item_observations(
+    def _append_item_observations(
         self,
         recoded_section: RecodedSection,
-        seed: str,
-    ) -> list[Observation]:
-        """Build observations for recoded items."""
-        observations: list[Observation] = []
-
+        observations: list[Observation],
+    ) -> None:
+        """Append observations for recoded items to the shared list."""
         for item in recoded_section.items:
-            value_type = self._get_value_type(item.value)
-
-            obs = Observation(
-                schema="com.lifeos.observation.v1",
-                observation_id=self._generate_id(f"{seed}:item:{item.item_id}"),
+            # Classified at recoding time; fall back for items built via
+            # model_construct, which skips the deriving validator
+            value_type = item.value_type
+            if value_type is None:
+                value_type = self._get_value_type(item.value)
+
+            obs = Observation.model_construct(
+                observation_id=self._generate_id(b":item:" + item.item_id.encode()),
                 measure_id=item.measure_id,
                 code=item.item_id,
-                kind="item",
+                kind=_KIND_ITEM,
                 value=item.value,
                 value_type=value_type,
                 raw_answer=str(item.raw_answer) if item.raw_answer is not None else None,
@@ -198,55 +309,43 @@ class MeasurementEventBuilder:
             )
             observations.append(obs)
 
-        return observations
-
-    def _build_scale_observations(
+    def _append_scale_observations(
         self,
         scoring_result: ScoringResult,
         interpretation_result: InterpretationResult,
-        seed: str,
-    ) -> list[Observation]:
-        """Build observations for scale scores."""
-        observations: list[Observation] = []
+        observations: list[Observation],
+    ) -> None:
+        """Append observations for scale scores to the shared list."""
+        # Materialize labels once; get_score() is a linear scan per call
+        labels_by_scale = {s.scale_id: s.label for s in interpretation_result.scores}
 
         for scale_score in scoring_result.scales:
-            # Get interpretation label
-            interpreted = interpretation_result.get_score(scale_score.scale_id)
-            label = interpreted.label if interpreted else None
+            label = labels_by_scale.get(scale_score.scale_id)
 
-            value_type = self._get_value_type(scale_score.value)
+            value_type = scale_score.value_type
+            if value_type is None:
+                value_type = self._get_value_type(scale_score.value)
 
-            obs = Observation(
-                schema="com.lifeos.observation.v1",
-                observation_id=self._generate_id(f"{seed}:scale:{scale_score.scale_id}"),
+            obs = Observation.model_construct(
+                observation_id=self._generate_id(b":scale:" + scale_score.scale_id.encode()),
                 measure_id=scoring_result.measure_id,
                 code=scale_score.scale_id,
-                kind="scale",
+                kind=_KIND_SCALE,
                 value=scale_score.value,
                 value_type=value_type,
                 label=label,
             )
             observations.append(obs)
 
-        return observations
-
     def _get_value_type(
         self,
         value: int | float | str | None,
     ) -> Literal["integer", "float", "string", "null"]:
         """Determine the value type for an observation."""
-        if value is None:
-            return "null"
-        elif isinstance(value, bool):
-            return "integer"  # Treat bools as int
-        elif isinstance(value, int):
-            return "integer"
-        elif isinstance(value, float):
+        value_type = self._VALUE_TYPES.get(type(value))
+        if value_type is not None:
+            return value_type
+        if isinstance(value, float):
             # Check if it's a whole number stored as float
-            if value.is_integer():
-                return "integer"
-            return "float"
-        elif isinstance(value, str):
-            return "string"
-        else:
-            return "string"
+            return _VT_INTEGER if value.is_integer() else _VT_FLOAT
+        return _VT_STRING
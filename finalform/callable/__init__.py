@@ -1,6 +1,6 @@
 """Callable protocol for finalform."""
 
-from finalform.callable.execute import execute
+from finalform.callable.execute import clear_pipeline_cache, execute
 from finalform.callable.result import CallableResult
 
-__all__ = ["CallableResult", "execute"]
+__all__ = ["CallableResult", "clear_pipeline_cache", "execute"]
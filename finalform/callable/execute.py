@@ -5,13 +5,55 @@ Provides the in-proc execute() function that lorchestra calls directly.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from pydantic import TypeAdapter
+
+from finalform.builders.measurement import MeasurementEvent
 from finalform.callable.result import CallableResult
 from finalform.config import get_binding_registry_path, get_measure_registry_path
 from finalform.pipeline import Pipeline, PipelineConfig
 
+# Built once so event lists serialize through pydantic-core in a single
+# call instead of one model_dump per event
+_EVENT_LIST_ADAPTER = TypeAdapter(list[MeasurementEvent])
+
+
+@lru_cache(maxsize=64)
+def _get_pipeline(
+    measure_registry_path: str,
+    binding_registry_path: str,
+    binding_id: str,
+    binding_version: str | None,
+    deterministic_ids: bool,
+    max_workers: int | None,
+) -> Pipeline:
+    """Build (or reuse) a Pipeline for the given configuration.
+
+    Pipeline construction loads registries, parses specs, and compiles
+    schemas; in a long-lived process that cost would otherwise be paid
+    on every execute() call. Paths are passed as strings so the key is
+    hashable. Call clear_pipeline_cache() after editing registry files
+    in place.
+    """
+    return Pipeline(
+        PipelineConfig(
+            measure_registry_path=Path(measure_registry_path),
+            binding_registry_path=Path(binding_registry_path),
+            binding_id=binding_id,
+            binding_version=binding_version,
+            deterministic_ids=deterministic_ids,
+            max_workers=max_workers,
+        )
+    )
+
+
+def clear_pipeline_cache() -> None:
+    """Drop all cached Pipelines so registry changes are picked up."""
+    _get_pipeline.cache_clear()
+
 
 def execute(params: dict[str, Any]) -> dict[str, Any]:
     """Score/transform canonical items into measurement rows.
@@ -31,6 +73,8 @@ def execute(params: dict[str, Any]) -> dict[str, Any]:
                 - measure_registry_path: str - Override measure registry path
                 - binding_registry_path: str - Override binding registry path
                 - deterministic_ids: bool - Use deterministic IDs for testing
+                - max_workers: int - Process multi-response batches on a
+                  thread pool (default: sequential)
 
     Returns:
         CallableResult dict with:
@@ -66,19 +110,19 @@ def execute(params: dict[str, Any]) -> dict[str, Any]:
     binding_id = config.get("binding_id", instrument)
     binding_version = config.get("binding_version")
     deterministic_ids = config.get("deterministic_ids", False)
-
-    # Build pipeline config
-    pipeline_config = PipelineConfig(
-        measure_registry_path=measure_registry_path,
-        binding_registry_path=binding_registry_path,
-        binding_id=binding_id,
-        binding_version=binding_version,
-        deterministic_ids=deterministic_ids,
+    max_workers = config.get("max_workers")
+
+    # Pipelines are cached per configuration so repeated calls for the
+    # same instrument skip registry loading and schema compilation
+    pipeline = _get_pipeline(
+        str(measure_registry_path),
+        str(binding_registry_path),
+        binding_id,
+        binding_version,
+        deterministic_ids,
+        max_workers,
     )
 
-    # Create pipeline and process
-    pipeline = Pipeline(pipeline_config)
-
     # items can be a single form response or list of form responses
     # Handle empty items gracefully - nothing to score
     if isinstance(items, list) and len(items) == 0:
@@ -107,10 +151,10 @@ def execute(params: dict[str, Any]) -> dict[str, Any]:
 
     for result in results:
         if result.success:
-            for event in result.events:
-                # Serialize MeasurementEvent to dict
-                measurement_items.append(event.model_dump(by_alias=True))
-                output_count += 1
+            # Serialize MeasurementEvents to dicts in one adapter call
+            dumped = _EVENT_LIST_ADAPTER.dump_python(result.events, by_alias=True)
+            measurement_items.extend(dumped)
+            output_count += len(dumped)
         else:
             error_count += 1
 
@@ -124,7 +168,9 @@ def execute(params: dict[str, Any]) -> dict[str, Any]:
 
     # Build and return CallableResult
     # v0: always return items inline (items_ref deferred until artifact store)
-    result = CallableResult(
+    # model_construct skips the items/items_ref XOR validator, which holds
+    # trivially here since this path never sets items_ref
+    result = CallableResult.model_construct(
         schema_version="1.0",
         items=measurement_items,
         stats=stats,
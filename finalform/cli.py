@@ -1,24 +1,16 @@
 """CLI for finalform semantic processing engine."""
 
-import json
-import os
 import shutil
 from pathlib import Path
 from typing import Annotated
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from finalform import __version__
-from finalform.config import (
-    get_binding_registry_path,
-    get_final_form_home,
-    get_measure_registry_path,
-    get_registry_root,
-    load_global_config,
-)
-from finalform.pipeline import Pipeline, PipelineConfig
+
+# Heavy imports (pipeline/pydantic, rich.progress, orjson, config/yaml) are
+# deferred into the commands that use them so --version/--help stay fast.
 
 app = typer.Typer(
     name="finalform",
@@ -28,6 +20,35 @@ app = typer.Typer(
 console = Console()
 
 
+def _fast_copytree(src: Path, dst: Path) -> None:
+    """Copy a registry tree, avoiding full byte copies where possible.
+
+    Tries a reflink-aware `cp -a` first (instant clones on btrfs/xfs),
+    then hardlinks (same-filesystem copies become O(entries)), and
+    finally falls back to a plain copytree. Registry files are read-only
+    after sync, so hardlinked copies are safe.
+    """
+    import subprocess
+    import sys
+
+    if sys.platform == "linux":
+        result = subprocess.run(
+            ["cp", "-a", "--reflink=auto", str(src), str(dst)],
+            capture_output=True,
+        )
+        if result.returncode == 0:
+            return
+
+    import os
+
+    try:
+        shutil.copytree(src, dst, copy_function=os.link)
+    except OSError:
+        # Cross-filesystem copy; hardlinks can't span devices
+        shutil.rmtree(dst, ignore_errors=True)
+        shutil.copytree(src, dst)
+
+
 def version_callback(value: bool) -> None:
     if value:
         console.print(f"finalform version {__version__}")
@@ -77,6 +98,13 @@ def init(
     """
     import yaml
 
+    from finalform.config import (
+        get_binding_registry_path,
+        get_final_form_home,
+        get_measure_registry_path,
+        get_registry_root,
+    )
+
     home = get_final_form_home()
     registry_root = get_registry_root()
     measure_dest = get_measure_registry_path()
@@ -115,7 +143,7 @@ def init(
     console.print(f"  Syncing measure-registry from {source_measure}...")
     if measure_dest.exists():
         shutil.rmtree(measure_dest)
-    shutil.copytree(source_measure, measure_dest)
+    _fast_copytree(source_measure, measure_dest)
     measure_count = len(list(measure_dest.glob("measures/*")))
     console.print(f"    [green]✓[/green] {measure_count} measures synced")
 
@@ -123,7 +151,7 @@ def init(
     console.print(f"  Syncing form-binding-registry from {source_binding}...")
     if binding_dest.exists():
         shutil.rmtree(binding_dest)
-    shutil.copytree(source_binding, binding_dest)
+    _fast_copytree(source_binding, binding_dest)
     binding_count = len(list(binding_dest.glob("bindings/*")))
     console.print(f"    [green]✓[/green] {binding_count} bindings synced")
 
@@ -142,6 +170,56 @@ def init(
     console.print(f"  Registry: {registry_root}")
 
 
+# Per-process state for --workers > 1: each worker builds its Pipeline once
+# in the pool initializer rather than per task.
+_worker_pipeline = None
+_worker_want_diagnostics = False
+
+
+def _init_worker(pipeline_config, want_diagnostics: bool) -> None:
+    """Build the worker-local Pipeline for a process pool worker."""
+    global _worker_pipeline, _worker_want_diagnostics
+    from finalform.pipeline import Pipeline
+
+    _worker_pipeline = Pipeline(pipeline_config)
+    _worker_want_diagnostics = want_diagnostics
+
+
+def _process_line(line: bytes) -> tuple[bytes, bytes | None, str, str | None]:
+    """Process one JSONL line in a pool worker.
+
+    Returns pre-serialized (events_bytes, diag_bytes, status, parse_error)
+    so the parent process only has to write bytes and count statuses.
+    """
+    import orjson
+
+    try:
+        form_response = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        return b"", None, "", str(e)
+
+    from finalform.diagnostics import release_diagnostic
+
+    assert _worker_pipeline is not None
+    result = _worker_pipeline.process(form_response)
+
+    events_bytes = b""
+    if result.events:
+        events_bytes = b"\n".join(event.to_json_bytes() for event in result.events) + b"\n"
+
+    diag_bytes = None
+    if _worker_want_diagnostics:
+        diag_bytes = orjson.dumps(
+            result.diagnostics.model_dump(mode="json"),
+            option=orjson.OPT_APPEND_NEWLINE,
+        )
+
+    status = result.diagnostics.status.value
+    # Everything is serialized; recycle the diagnostic records
+    release_diagnostic(result.diagnostics)
+    return events_bytes, diag_bytes, status, None
+
+
 @app.command()
 def run(
     input_path: Annotated[
@@ -180,6 +258,10 @@ def run(
         Path | None,
         typer.Option("--diagnostics", "-d", help="Diagnostics output JSONL path"),
     ] = None,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", help="Worker processes (1 = in-process)"),
+    ] = 1,
 ) -> None:
     """Process form responses and emit MeasurementEvents.
 
@@ -187,28 +269,29 @@ def run(
     - Input JSONL file with canonical form responses
     - Output path for MeasurementEvents JSONL
     - Binding spec ID (required, no auto-detection)
+
+    With --workers > 1, lines are processed in a process pool; each worker
+    builds its own Pipeline once and output order is preserved.
     """
-    # Resolve registry paths
-    if measure_registry is None:
-        env_path = os.environ.get("FINAL_FORM_MEASURE_REGISTRY")
-        if env_path:
-            measure_registry = Path(env_path)
-        else:
-            measure_registry = Path("measure-registry")
+    import orjson
+    from rich.progress import Progress, SpinnerColumn, TextColumn
 
+    from finalform.config import load_global_config
+    from finalform.diagnostics import release_diagnostic
+    from finalform.pipeline import Pipeline, PipelineConfig
 
+    # Resolve registry paths; typer's envvar option already applied the
+    # FINAL_FORM_* environment variables, so None means "not configured"
+    if measure_registry is None:
+        measure_registry = Path("measure-registry")
 
     if form_binding_registry is None:
-        env_path = os.environ.get("FINAL_FORM_BINDING_REGISTRY")
-        if env_path:
-            form_binding_registry = Path(env_path)
+        # Check global config
+        global_config = load_global_config()
+        if global_config.default_form_binding_registry_path:
+            form_binding_registry = Path(global_config.default_form_binding_registry_path)
         else:
-             # Check global config
-            global_config = load_global_config()
-            if global_config.default_form_binding_registry_path:
-                form_binding_registry = Path(global_config.default_form_binding_registry_path)
-            else:
-                form_binding_registry = Path("form-binding-registry")
+            form_binding_registry = Path("form-binding-registry")
 
     # Resolve measure registry from config if still default
     if str(measure_registry) == "measure-registry":
@@ -276,47 +359,104 @@ def run(
     ) as progress:
         task = progress.add_task("Processing forms...", total=None)
 
-        with open(input_path) as f_in, open(output_path, "w") as f_out:
+        # 1 MiB buffers amortize read/write syscalls across many records
+        with (
+            open(input_path, "rb", buffering=1 << 20) as f_in,
+            open(output_path, "wb", buffering=1 << 20) as f_out,
+        ):
             # Open diagnostics file if requested
-            f_diag = open(diagnostics, "w") if diagnostics else None
+            f_diag = open(diagnostics, "wb", buffering=1 << 20) if diagnostics else None
 
             try:
-                for line_num, line in enumerate(f_in, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        form_response = json.loads(line)
-                    except json.JSONDecodeError as e:
-                        console.print(
-                            f"\n[yellow]Warning:[/yellow] Invalid JSON on line {line_num}: {e}"
-                        )
-                        continue
-
-                    # Process the form response
-                    result = pipeline.process(form_response)
-
-                    # Write events
-                    for event in result.events:
-                        f_out.write(event.model_dump_json(by_alias=True) + "\n")
-                        events_written += 1
-
-                    # Write diagnostics
-                    if f_diag:
-                        f_diag.write(result.diagnostics.model_dump_json() + "\n")
-                        diagnostics_written += 1
-
-                    # Track status
-                    status = result.diagnostics.status.value
-                    if status == "success":
-                        success_count += 1
-                    elif status == "partial":
-                        partial_count += 1
-                    else:
-                        failed_count += 1
-
-                    progress.update(task, description=f"Processed {line_num} forms...")
+                if workers > 1:
+                    # Each line is independent; fan out to a process pool.
+                    # pool.map preserves input order, so the single-threaded
+                    # writer below keeps output deterministic.
+                    from concurrent.futures import ProcessPoolExecutor
+
+                    lines = (line for line in f_in if line.strip())
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=_init_worker,
+                        initargs=(config, diagnostics is not None),
+                    ) as pool:
+                        results = pool.map(_process_line, lines, chunksize=64)
+                        for line_num, (events_bytes, diag_bytes, status, parse_error) in (
+                            enumerate(results, 1)
+                        ):
+                            if parse_error:
+                                console.print(
+                                    f"\n[yellow]Warning:[/yellow] Invalid JSON: {parse_error}"
+                                )
+                                continue
+                            if events_bytes:
+                                f_out.write(events_bytes)
+                                events_written += events_bytes.count(b"\n")
+                            if f_diag and diag_bytes:
+                                f_diag.write(diag_bytes)
+                                diagnostics_written += 1
+                            if status == "success":
+                                success_count += 1
+                            elif status == "partial":
+                                partial_count += 1
+                            else:
+                                failed_count += 1
+                            if line_num & 0xFF == 0:
+                                progress.update(
+                                    task, description=f"Processed {line_num} forms..."
+                                )
+                else:
+                    for line_num, line in enumerate(f_in, 1):
+                        line = line.strip()
+                        if not line:
+                            continue
+
+                        try:
+                            form_response = orjson.loads(line)
+                        except orjson.JSONDecodeError as e:
+                            console.print(
+                                f"\n[yellow]Warning:[/yellow] Invalid JSON on line {line_num}: {e}"
+                            )
+                            continue
+
+                        # Process the form response
+                        result = pipeline.process(form_response)
+
+                        # Write events
+                        if result.events:
+                            f_out.write(
+                                b"\n".join(event.to_json_bytes() for event in result.events)
+                                + b"\n"
+                            )
+                            events_written += len(result.events)
+
+                        # Write diagnostics
+                        if f_diag:
+                            f_diag.write(
+                                orjson.dumps(
+                                    result.diagnostics.model_dump(mode="json"),
+                                    option=orjson.OPT_APPEND_NEWLINE,
+                                )
+                            )
+                            diagnostics_written += 1
+
+                        # Track status
+                        status = result.diagnostics.status.value
+                        if status == "success":
+                            success_count += 1
+                        elif status == "partial":
+                            partial_count += 1
+                        else:
+                            failed_count += 1
+
+                        # Events and diagnostics are written; recycle the
+                        # diagnostic records for the next line
+                        release_diagnostic(result.diagnostics)
+
+                        # Rich rebuilds the spinner layout on every update; throttle
+                        # to every 256 lines so it stays off the hot path
+                        if line_num & 0xFF == 0:
+                            progress.update(task, description=f"Processed {line_num} forms...")
             finally:
                 if f_diag:
                     f_diag.close()
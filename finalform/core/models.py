@@ -5,9 +5,7 @@ These models represent the unified output contract for all
 measurement domains.
 """
 
-from typing import Any
-
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 
 # Re-export from builders - these are the canonical definitions
 from finalform.builders.measurement import (
@@ -16,6 +14,7 @@ from finalform.builders.measurement import (
     Source,
     Telemetry,
 )
+from finalform.diagnostics.models import FormDiagnostic
 
 
 class ProcessingResult(BaseModel):
@@ -27,11 +26,9 @@ class ProcessingResult(BaseModel):
 
     form_submission_id: str
     events: list[MeasurementEvent]
-    diagnostics: Any  # ProcessingDiagnostics - forward reference to avoid circular import
+    diagnostics: FormDiagnostic  # aliased as ProcessingDiagnostics in core.diagnostics
     success: bool
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
 
 __all__ = [
     "MeasurementEvent",
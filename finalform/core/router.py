@@ -112,18 +112,12 @@ class DomainRouter:
                 success=True,
             )
 
-        # Group measures by kind
-        measures_by_kind: dict[str, dict[str, MeasureSpec]] = {}
-        for measure_id, measure in measures.items():
-            kind = measure.kind
-            if kind not in measures_by_kind:
-                measures_by_kind[kind] = {}
-            measures_by_kind[kind][measure_id] = measure
-
-        # For now, we process all measures with a single processor
-        # This works because current forms have homogeneous measure kinds
+        # For now, we process all measures with a single processor, selected
+        # by the first measure's kind. This works because current forms have
+        # homogeneous measure kinds, and avoids rebuilding a group-by-kind
+        # dict on every call for a measures set that is fixed per batch.
         # Future: aggregate results from multiple processors
-        first_kind = next(iter(measures_by_kind.keys()))
+        first_kind = next(iter(measures.values())).kind
         processor = self.get_processor(first_kind)
 
         return processor.process(
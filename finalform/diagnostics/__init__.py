@@ -4,7 +4,7 @@ Tracks errors, warnings, and quality metrics throughout the
 form processing pipeline.
 """
 
-from finalform.diagnostics.collector import DiagnosticsCollector
+from finalform.diagnostics.collector import DiagnosticsCollector, release_diagnostic
 from finalform.diagnostics.models import (
     DiagnosticError,
     DiagnosticWarning,
@@ -22,4 +22,5 @@ __all__ = [
     "MeasureDiagnostic",
     "ProcessingStatus",
     "QualityMetrics",
+    "release_diagnostic",
 ]
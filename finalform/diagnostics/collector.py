@@ -4,8 +4,14 @@ Collects errors, warnings, and quality metrics throughout the pipeline
 and produces a complete diagnostic report for each form submission.
 """
 
+import sys
+from array import array
+from collections import deque
+from itertools import chain
 from typing import Literal
 
+import orjson
+
 from finalform.diagnostics.models import (
     DiagnosticError,
     DiagnosticWarning,
@@ -20,6 +26,50 @@ from finalform.scoring.engine import ScoringResult
 from finalform.validation.checks import ValidationResult
 
 
+# Interned code constants: the same handful of codes recur on every record,
+# so sharing one str object per code keeps per-record memory flat and makes
+# downstream `code == X` checks pointer compares.
+CODE_UNMAPPED_FIELD = sys.intern("UNMAPPED_FIELD")
+CODE_MISSING_VALUE = sys.intern("MISSING_VALUE")
+CODE_VALIDATION_ERROR = sys.intern("VALIDATION_ERROR")
+CODE_VALIDATION_MISSING = sys.intern("VALIDATION_MISSING")
+CODE_VALIDATION_RANGE = sys.intern("VALIDATION_RANGE")
+CODE_SCORING_ERROR = sys.intern("SCORING_ERROR")
+CODE_PRORATED_SCORE = sys.intern("PRORATED_SCORE")
+
+# Bounded free-lists for the per-record dataclasses. High-throughput batch
+# runs allocate and drop thousands of these; recycling via
+# release_diagnostic() keeps the pressure off the allocator.
+_POOL_MAX = 1024
+_error_pool: deque[DiagnosticError] = deque(maxlen=_POOL_MAX)
+_warning_pool: deque[DiagnosticWarning] = deque(maxlen=_POOL_MAX)
+
+
+def _record_dict(record: DiagnosticError | DiagnosticWarning) -> dict:
+    """Render an error/warning record as a plain dict for serialization."""
+    return {
+        "stage": record.stage,
+        "code": record.code,
+        "message": record.message,
+        "item_id": record.item_id,
+        "field_key": record.field_key,
+        "details": record.details,
+    }
+
+
+def release_diagnostic(diagnostic: FormDiagnostic) -> None:
+    """Return a FormDiagnostic's error/warning records to the free-lists.
+
+    Only call this after the diagnostic has been serialized or copied —
+    the records are mutated in place when reused by a later collector.
+    """
+    _error_pool.extend(e for e in diagnostic.errors if type(e) is DiagnosticError)
+    _warning_pool.extend(w for w in diagnostic.warnings if type(w) is DiagnosticWarning)
+    for measure in diagnostic.measures:
+        _error_pool.extend(e for e in measure.errors if type(e) is DiagnosticError)
+        _warning_pool.extend(w for w in measure.warnings if type(w) is DiagnosticWarning)
+
+
 class DiagnosticsCollector:
     """Collects diagnostics throughout the processing pipeline.
 
@@ -50,6 +100,7 @@ class DiagnosticsCollector:
         self._form_errors: list[DiagnosticError] = []
         self._form_warnings: list[DiagnosticWarning] = []
         self._measures: dict[str, MeasureDiagnostic] = {}
+        self._finalized: FormDiagnostic | None = None
 
     def add_error(
         self,
@@ -74,18 +125,26 @@ class DiagnosticsCollector:
             field_key: Optional field key the error relates to.
             details: Optional additional details.
         """
-        error = DiagnosticError(
-            stage=stage,
-            code=code,
-            message=message,
-            item_id=item_id,
-            field_key=field_key,
-            details=details,
-        )
+        if _error_pool:
+            error = _error_pool.pop()
+            error.stage = stage
+            error.code = code
+            error.message = message
+            error.item_id = item_id
+            error.field_key = field_key
+            error.details = details
+        else:
+            error = DiagnosticError(
+                stage=stage,
+                code=code,
+                message=message,
+                item_id=item_id,
+                field_key=field_key,
+                details=details,
+            )
 
         if measure_id:
-            self._ensure_measure(measure_id)
-            self._measures[measure_id].errors.append(error)
+            self._ensure_measure(measure_id).errors.append(error)
         else:
             self._form_errors.append(error)
 
@@ -112,18 +171,26 @@ class DiagnosticsCollector:
             field_key: Optional field key the warning relates to.
             details: Optional additional details.
         """
-        warning = DiagnosticWarning(
-            stage=stage,
-            code=code,
-            message=message,
-            item_id=item_id,
-            field_key=field_key,
-            details=details,
-        )
+        if _warning_pool:
+            warning = _warning_pool.pop()
+            warning.stage = stage
+            warning.code = code
+            warning.message = message
+            warning.item_id = item_id
+            warning.field_key = field_key
+            warning.details = details
+        else:
+            warning = DiagnosticWarning(
+                stage=stage,
+                code=code,
+                message=message,
+                item_id=item_id,
+                field_key=field_key,
+                details=details,
+            )
 
         if measure_id:
-            self._ensure_measure(measure_id)
-            self._measures[measure_id].warnings.append(warning)
+            self._ensure_measure(measure_id).warnings.append(warning)
         else:
             self._form_warnings.append(warning)
 
@@ -131,14 +198,16 @@ class DiagnosticsCollector:
         self,
         measure_id: str,
         measure_version: str = "unknown",
-    ) -> None:
-        """Ensure a measure diagnostic exists."""
-        if measure_id not in self._measures:
-            self._measures[measure_id] = MeasureDiagnostic(
+    ) -> MeasureDiagnostic:
+        """Ensure a measure diagnostic exists and return it."""
+        inst = self._measures.get(measure_id)
+        if inst is None:
+            inst = self._measures[measure_id] = MeasureDiagnostic(
                 measure_id=measure_id,
                 measure_version=measure_version,
                 status=ProcessingStatus.SUCCESS,
             )
+        return inst
 
     def collect_from_mapping(
         self,
@@ -150,15 +219,14 @@ class DiagnosticsCollector:
             mapping_result: The result from the mapping stage.
         """
         for section in mapping_result.sections:
-            self._ensure_measure(section.measure_id, section.measure_version)
-            inst = self._measures[section.measure_id]
+            inst = self._ensure_measure(section.measure_id, section.measure_version)
             inst.measure_version = section.measure_version
 
         # Collect warnings for unmapped fields
         for field_key in mapping_result.unmapped_fields:
             self.add_warning(
                 stage="mapping",
-                code="UNMAPPED_FIELD",
+                code=CODE_UNMAPPED_FIELD,
                 message=f"Field {field_key} was not mapped to any measure item",
                 field_key=field_key,
             )
@@ -173,17 +241,14 @@ class DiagnosticsCollector:
             recoding_result: The result from the recoding stage.
         """
         for section in recoding_result.sections:
-            self._ensure_measure(section.measure_id, section.measure_version)
+            inst = self._ensure_measure(section.measure_id, section.measure_version)
 
+            # Record bare item IDs; finalize() rolls them up into a single
+            # MISSING_VALUE warning instead of one record per missing item
+            missing_ids = inst.missing_item_ids
             for item in section.items:
                 if item.missing:
-                    self.add_warning(
-                        stage="recoding",
-                        code="MISSING_VALUE",
-                        message=f"Item {item.item_id} has missing value",
-                        measure_id=section.measure_id,
-                        item_id=item.item_id,
-                    )
+                    missing_ids.append(item.item_id)
 
     def collect_from_validation(
         self,
@@ -202,7 +267,7 @@ class DiagnosticsCollector:
         for error_msg in validation_result.errors:
             self.add_error(
                 stage="validation",
-                code="VALIDATION_ERROR",
+                code=CODE_VALIDATION_ERROR,
                 message=error_msg,
                 measure_id=measure_id,
             )
@@ -211,24 +276,26 @@ class DiagnosticsCollector:
         for item_id in validation_result.missing_items:
             self.add_warning(
                 stage="validation",
-                code="VALIDATION_MISSING",
+                code=CODE_VALIDATION_MISSING,
                 message=f"Item {item_id} is missing",
                 measure_id=measure_id,
                 item_id=item_id,
             )
 
-        # Collect errors for out-of-range items (if not already in errors)
-        for item_id in validation_result.out_of_range_items:
-            # Check if there's already an error message for this item
-            has_error = any(item_id in e for e in validation_result.errors)
-            if not has_error:
-                self.add_error(
-                    stage="validation",
-                    code="VALIDATION_RANGE",
-                    message=f"Item {item_id} has out-of-range value",
-                    measure_id=measure_id,
-                    item_id=item_id,
-                )
+        # Collect errors for out-of-range items (if not already in errors).
+        # Join the error messages once so each item is a single substring
+        # probe instead of a scan over every error message.
+        if validation_result.out_of_range_items:
+            error_blob = "\n".join(validation_result.errors)
+            for item_id in validation_result.out_of_range_items:
+                if item_id not in error_blob:
+                    self.add_error(
+                        stage="validation",
+                        code=CODE_VALIDATION_RANGE,
+                        message=f"Item {item_id} has out-of-range value",
+                        measure_id=measure_id,
+                        item_id=item_id,
+                    )
 
     def collect_from_scoring(
         self,
@@ -245,7 +312,7 @@ class DiagnosticsCollector:
             if scale.error:
                 self.add_error(
                     stage="scoring",
-                    code="SCORING_ERROR",
+                    code=CODE_SCORING_ERROR,
                     message=scale.error,
                     measure_id=scoring_result.measure_id,
                     details={"scale_id": scale.scale_id},
@@ -253,7 +320,7 @@ class DiagnosticsCollector:
             if scale.prorated:
                 self.add_warning(
                     stage="scoring",
-                    code="PRORATED_SCORE",
+                    code=CODE_PRORATED_SCORE,
                     message=f"Scale {scale.scale_id} was prorated due to missing items",
                     measure_id=scoring_result.measure_id,
                     details={
@@ -281,11 +348,11 @@ class DiagnosticsCollector:
             out_of_range_items: List of out-of-range item IDs.
             prorated_scales: List of scales that were prorated.
         """
-        self._ensure_measure(measure_id)
+        inst = self._ensure_measure(measure_id)
 
         completeness = items_present / items_total if items_total > 0 else 0.0
 
-        self._measures[measure_id].quality = QualityMetrics(
+        inst.quality = QualityMetrics(
             completeness=completeness,
             missing_items=missing_items,
             out_of_range_items=out_of_range_items,
@@ -294,47 +361,282 @@ class DiagnosticsCollector:
             items_present=items_present,
         )
 
-    def finalize(self) -> FormDiagnostic:
+    def to_columnar(self) -> dict[str, list[str] | array]:
+        """Emit per-measure diagnostics as parallel columnar arrays.
+
+        Bulk aggregation across many submissions is much cheaper over flat
+        typed columns than over the per-measure object graph. Numeric
+        columns are stdlib ``array`` instances, which expose the buffer
+        protocol so NumPy or Arrow can wrap them zero-copy. ``missing_items``
+        uses an Arrow-style list layout: a flat value list plus an offsets
+        array where measure ``i`` owns ``missing_items[offsets[i]:offsets[i+1]]``.
+
+        Returns:
+            Dict of parallel columns keyed by column name. ``statuses``
+            encodes ProcessingStatus as int8 (success=0, partial=1, failed=2).
+        """
+        measure_ids: list[str] = []
+        statuses = array("b")
+        completeness = array("f")
+        items_total = array("l")
+        items_present = array("l")
+        missing_items: list[str] = []
+        offsets = array("l", [0])
+
+        for measure_id, inst in self._measures.items():
+            measure_ids.append(measure_id)
+            # Same status rule as finalize(), so this works before or after it
+            if inst.errors:
+                statuses.append(2)
+            elif inst.warnings or inst.missing_item_ids:
+                statuses.append(1)
+            else:
+                statuses.append(0)
+
+            quality = inst.quality
+            if quality is not None:
+                completeness.append(quality.completeness)
+                items_total.append(quality.items_total)
+                items_present.append(quality.items_present)
+                missing_items.extend(quality.missing_items)
+            else:
+                completeness.append(0.0)
+                items_total.append(0)
+                items_present.append(0)
+            offsets.append(len(missing_items))
+
+        return {
+            "measure_ids": measure_ids,
+            "statuses": statuses,
+            "completeness": completeness,
+            "items_total": items_total,
+            "items_present": items_present,
+            "missing_items": missing_items,
+            "missing_items_offsets": offsets,
+        }
+
+    def finalize_bytes(self) -> bytes:
+        """Serialize the diagnostic report straight to JSON bytes.
+
+        Produces the same JSON as ``finalize().model_dump(mode="json")``
+        but builds plain dicts from the collector's internal state, so
+        persistence-only callers skip FormDiagnostic construction and
+        validation entirely. Does not mutate collector state; finalize()
+        can still be called afterwards.
+
+        Returns:
+            UTF-8 JSON bytes for the complete diagnostic report.
+        """
+        has_failed = False
+        has_partial = False
+        total_items = 0
+        present_items = 0
+        all_missing: list[str] = []
+        all_out_of_range: list[str] = []
+        all_prorated: list[str] = []
+        measures_out: list[dict] = []
+
+        for inst in self._measures.values():
+            errors = [_record_dict(e) for e in inst.errors]
+            warnings = [_record_dict(w) for w in inst.warnings]
+            missing_ids = inst.missing_item_ids
+            if missing_ids:
+                warnings.append(
+                    {
+                        "stage": "recoding",
+                        "code": CODE_MISSING_VALUE,
+                        "message": f"{len(missing_ids)} item(s) have missing values",
+                        "item_id": None,
+                        "field_key": None,
+                        "details": {"item_ids": missing_ids},
+                    }
+                )
+
+            if errors:
+                status = "failed"
+                has_failed = True
+            elif warnings:
+                status = "partial"
+                has_partial = True
+            else:
+                status = "success"
+
+            quality = inst.quality
+            quality_out = None
+            if quality is not None:
+                total_items += quality.items_total
+                present_items += quality.items_present
+                all_missing.extend(quality.missing_items)
+                all_out_of_range.extend(quality.out_of_range_items)
+                all_prorated.extend(quality.prorated_scales)
+                quality_out = {
+                    "completeness": quality.completeness,
+                    "missing_items": quality.missing_items,
+                    "out_of_range_items": quality.out_of_range_items,
+                    "prorated_scales": quality.prorated_scales,
+                    "items_total": quality.items_total,
+                    "items_present": quality.items_present,
+                }
+
+            measures_out.append(
+                {
+                    "measure_id": inst.measure_id,
+                    "measure_version": inst.measure_version,
+                    "status": status,
+                    "errors": errors,
+                    "warnings": warnings,
+                    "missing_item_ids": missing_ids,
+                    "quality": quality_out,
+                }
+            )
+
+        if self._form_errors or has_failed:
+            form_status = "failed"
+        elif self._form_warnings or has_partial:
+            form_status = "partial"
+        else:
+            form_status = "success"
+
+        return orjson.dumps(
+            {
+                "form_submission_id": self.form_submission_id,
+                "form_id": self.form_id,
+                "binding_id": self.binding_id,
+                "binding_version": self.binding_version,
+                "status": form_status,
+                "measures": measures_out,
+                "errors": [_record_dict(e) for e in self._form_errors],
+                "warnings": [_record_dict(w) for w in self._form_warnings],
+                "quality": {
+                    "completeness": (
+                        present_items / total_items if total_items > 0 else 1.0
+                    ),
+                    "missing_items": all_missing,
+                    "out_of_range_items": all_out_of_range,
+                    "prorated_scales": all_prorated,
+                    "items_total": total_items,
+                    "items_present": present_items,
+                },
+            }
+        )
+
+    def finalize_status(self) -> ProcessingStatus:
+        """Compute the overall form status without building the full report.
+
+        Applies the same rules as finalize() but skips FormDiagnostic and
+        QualityMetrics construction, for callers that only need the status.
+
+        Returns:
+            Overall ProcessingStatus for the form submission.
+        """
+        has_failed = False
+        has_partial = False
+        for inst in self._measures.values():
+            if inst.errors:
+                has_failed = True
+                break
+            if inst.warnings or inst.missing_item_ids:
+                has_partial = True
+
+        if self._form_errors or has_failed:
+            return ProcessingStatus.FAILED
+        if self._form_warnings or has_partial:
+            return ProcessingStatus.PARTIAL
+        return ProcessingStatus.SUCCESS
+
+    def finalize(self, fast_fail: bool = False) -> FormDiagnostic:
         """Finalize and return the complete diagnostic report.
 
         Computes final status based on collected errors and warnings.
+        The report is built once and cached; diagnostics added after the
+        first call are not reflected in the returned model.
+
+        Args:
+            fast_fail: If True, the pipeline crashed partway through;
+                skip per-measure status and quality aggregation and
+                return a minimal FAILED report.
 
         Returns:
             Complete FormDiagnostic for the form submission.
         """
-        # Determine measure statuses
-        for inst in self._measures.values():
+        if self._finalized is not None:
+            return self._finalized
+
+        if fast_fail:
+            # After an early crash most measure diagnostics are empty
+            # placeholders; don't pay the aggregation cost for them
+            self._finalized = FormDiagnostic(
+                form_submission_id=self.form_submission_id,
+                form_id=self.form_id,
+                binding_id=self.binding_id,
+                binding_version=self.binding_version,
+                status=ProcessingStatus.FAILED,
+                measures=list(self._measures.values()),
+                errors=self._form_errors,
+                warnings=self._form_warnings,
+                quality=None,
+            )
+            return self._finalized
+
+        measures_list = list(self._measures.values())
+
+        # Bind enum members as locals so the loop body does identity
+        # compares without repeated attribute resolution
+        failed = ProcessingStatus.FAILED
+        partial = ProcessingStatus.PARTIAL
+        success = ProcessingStatus.SUCCESS
+
+        # Single pass over the measures: assign statuses, track whether any
+        # failed or were partial, and accumulate aggregate quality metrics
+        has_failed = False
+        has_partial = False
+        total_items = 0
+        present_items = 0
+        qualities: list[QualityMetrics] = []
+
+        for inst in measures_list:
+            # Roll accumulated missing-item IDs into one warning per measure
+            if inst.missing_item_ids:
+                self.add_warning(
+                    stage="recoding",
+                    code=CODE_MISSING_VALUE,
+                    message=(
+                        f"{len(inst.missing_item_ids)} item(s) have missing values"
+                    ),
+                    measure_id=inst.measure_id,
+                    details={"item_ids": inst.missing_item_ids},
+                )
+
             if inst.errors:
-                inst.status = ProcessingStatus.FAILED
+                inst.status = failed
+                has_failed = True
             elif inst.warnings:
-                inst.status = ProcessingStatus.PARTIAL
+                inst.status = partial
+                has_partial = True
             else:
-                inst.status = ProcessingStatus.SUCCESS
+                inst.status = success
+
+            quality = inst.quality
+            if quality is not None:
+                total_items += quality.items_total
+                present_items += quality.items_present
+                qualities.append(quality)
+
+        # Concatenate the aggregate lists in one allocation each via
+        # chain.from_iterable instead of growing them with repeated extends
+        all_missing = list(chain.from_iterable(q.missing_items for q in qualities))
+        all_out_of_range = list(
+            chain.from_iterable(q.out_of_range_items for q in qualities)
+        )
+        all_prorated = list(chain.from_iterable(q.prorated_scales for q in qualities))
 
         # Determine overall form status
-        measures_list = list(self._measures.values())
-
-        has_failed = any(i.status == ProcessingStatus.FAILED for i in measures_list)
-        has_partial = any(i.status == ProcessingStatus.PARTIAL for i in measures_list)
         if self._form_errors or has_failed:
-            form_status = ProcessingStatus.FAILED
+            form_status = failed
         elif self._form_warnings or has_partial:
-            form_status = ProcessingStatus.PARTIAL
+            form_status = partial
         else:
-            form_status = ProcessingStatus.SUCCESS
-
-        # Compute aggregate quality metrics
-        total_items = sum(i.quality.items_total for i in measures_list if i.quality)
-        present_items = sum(i.quality.items_present for i in measures_list if i.quality)
-        all_missing = []
-        all_out_of_range = []
-        all_prorated = []
-
-        for inst in measures_list:
-            if inst.quality:
-                all_missing.extend(inst.quality.missing_items)
-                all_out_of_range.extend(inst.quality.out_of_range_items)
-                all_prorated.extend(inst.quality.prorated_scales)
+            form_status = success
 
         form_quality = QualityMetrics(
             completeness=present_items / total_items if total_items > 0 else 1.0,
@@ -345,7 +647,7 @@ class DiagnosticsCollector:
             items_present=present_items,
         )
 
-        return FormDiagnostic(
+        self._finalized = FormDiagnostic(
             form_submission_id=self.form_submission_id,
             form_id=self.form_id,
             binding_id=self.binding_id,
@@ -356,3 +658,4 @@ class DiagnosticsCollector:
             warnings=self._form_warnings,
             quality=form_quality,
         )
+        return self._finalized
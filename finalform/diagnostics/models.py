@@ -4,6 +4,7 @@ Tracks processing status, errors, warnings, and quality metrics
 for each form submission through the pipeline.
 """
 
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Literal
 
@@ -18,7 +19,15 @@ class ProcessingStatus(str, Enum):
     FAILED = "failed"  # Processing failed with errors
 
 
-class DiagnosticError(BaseModel):
+# The per-error/warning/metric records below are produced internally (one
+# allocation per warning or item), so they are slotted dataclasses rather
+# than BaseModels: no validation cost, no per-instance __dict__. Pydantic
+# still validates and serializes them as fields of the BaseModels further
+# down.
+
+
+@dataclass(slots=True)
+class DiagnosticError:
     """An error that occurred during processing."""
 
     stage: Literal["mapping", "recoding", "validation", "scoring", "interpretation", "building"]
@@ -29,7 +38,8 @@ class DiagnosticError(BaseModel):
     details: dict | None = None
 
 
-class DiagnosticWarning(BaseModel):
+@dataclass(slots=True)
+class DiagnosticWarning:
     """A warning that occurred during processing."""
 
     stage: Literal["mapping", "recoding", "validation", "scoring", "interpretation", "building"]
@@ -40,13 +50,14 @@ class DiagnosticWarning(BaseModel):
     details: dict | None = None
 
 
-class QualityMetrics(BaseModel):
+@dataclass(slots=True)
+class QualityMetrics:
     """Quality metrics for a processed form."""
 
-    completeness: float = Field(ge=0.0, le=1.0)  # Fraction of items present
-    missing_items: list[str] = Field(default_factory=list)
-    out_of_range_items: list[str] = Field(default_factory=list)
-    prorated_scales: list[str] = Field(default_factory=list)
+    completeness: float  # Fraction of items present, 0.0 to 1.0
+    missing_items: list[str] = field(default_factory=list)
+    out_of_range_items: list[str] = field(default_factory=list)
+    prorated_scales: list[str] = field(default_factory=list)
     items_total: int = 0
     items_present: int = 0
 
@@ -59,6 +70,9 @@ class MeasureDiagnostic(BaseModel):
     status: ProcessingStatus
     errors: list[DiagnosticError] = Field(default_factory=list)
     warnings: list[DiagnosticWarning] = Field(default_factory=list)
+    # Missing items are recorded as bare IDs during collection; finalize()
+    # rolls them up into a single MISSING_VALUE warning per measure
+    missing_item_ids: list[str] = Field(default_factory=list)
     quality: QualityMetrics | None = None
 
 
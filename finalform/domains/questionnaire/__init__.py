@@ -5,8 +5,12 @@ and checklists. This is the primary domain for patient-reported
 outcome measures (PROMs).
 """
 
-from finalform.domains.questionnaire.processor import QuestionnaireProcessor
+from finalform.domains.questionnaire.processor import (
+    CompiledQuestionnaireProcessor,
+    QuestionnaireProcessor,
+)
 
 __all__ = [
+    "CompiledQuestionnaireProcessor",
     "QuestionnaireProcessor",
 ]
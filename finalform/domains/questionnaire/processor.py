@@ -18,6 +18,10 @@ from finalform.registry.models import FormBindingSpec, MeasureSpec
 from finalform.scoring import ScoringEngine
 from finalform.validation import Validator
 
+# Hoisted so the per-submission success check is a tuple of identity
+# compares with no enum attribute resolution
+_OK_STATUSES = (ProcessingStatus.SUCCESS, ProcessingStatus.PARTIAL)
+
 
 class QuestionnaireProcessor:
     """Processor for questionnaire-type measures.
@@ -35,6 +39,7 @@ class QuestionnaireProcessor:
         self.validator = Validator()
         self.scoring_engine = ScoringEngine()
         self.interpreter = Interpreter()
+        self._validate_cache: dict[tuple[str, str], list[str]] = {}
 
     @property
     def supported_kinds(self) -> tuple[str, ...]:
@@ -82,6 +87,7 @@ class QuestionnaireProcessor:
 
         events: list[MeasurementEvent] = []
         warnings: list[str] = []
+        pipeline_failed = False
 
         try:
             # 1. Map form items to measure items
@@ -109,16 +115,6 @@ class QuestionnaireProcessor:
                 )
                 collector.collect_from_validation(validation_result, section.measure_id)
 
-                # Set quality metrics
-                collector.set_measure_quality(
-                    measure_id=section.measure_id,
-                    items_total=len(measure.items),
-                    items_present=len([i for i in section.items if not i.missing]),
-                    missing_items=validation_result.missing_items,
-                    out_of_range_items=validation_result.out_of_range_items,
-                    prorated_scales=[],  # Will be filled from scoring
-                )
-
                 # 3b. Score
                 scoring_result = self.scoring_engine.score(
                     section=section,
@@ -126,17 +122,19 @@ class QuestionnaireProcessor:
                 )
                 collector.collect_from_scoring(scoring_result)
 
-                # Update prorated scales
+                # Set quality metrics once, now that prorated scales are known
                 prorated = [s.scale_id for s in scoring_result.scales if s.prorated]
-                if prorated:
-                    collector.set_measure_quality(
-                        measure_id=section.measure_id,
-                        items_total=len(measure.items),
-                        items_present=len([i for i in section.items if not i.missing]),
-                        missing_items=validation_result.missing_items,
-                        out_of_range_items=validation_result.out_of_range_items,
-                        prorated_scales=prorated,
-                    )
+                items_present = section.items_present
+                if items_present is None:  # sections built via model_construct
+                    items_present = sum(1 for i in section.items if not i.missing)
+                collector.set_measure_quality(
+                    measure_id=section.measure_id,
+                    items_total=len(measure.items),
+                    items_present=items_present,
+                    missing_items=validation_result.missing_items,
+                    out_of_range_items=validation_result.out_of_range_items,
+                    prorated_scales=prorated,
+                )
 
                 # Collect warnings for prorated scores
                 section_warnings: list[str] = []
@@ -169,25 +167,72 @@ class QuestionnaireProcessor:
                 warnings.extend(section_warnings)
 
         except Exception as e:
+            pipeline_failed = True
             collector.add_error(
                 stage="building",
                 code="PIPELINE_ERROR",
                 message=str(e),
             )
 
-        # Finalize diagnostics
-        form_diagnostic = collector.finalize()
-
-        # FormDiagnostic is now ProcessingDiagnostics (they're the same type)
-        diagnostics = form_diagnostic
+        # Finalize diagnostics (minimal report if the pipeline crashed)
+        form_diagnostic = collector.finalize(fast_fail=pipeline_failed)
 
         return ProcessingResult(
             form_submission_id=form_submission_id,
             events=events,
-            diagnostics=diagnostics,
-            success=diagnostics.status in (ProcessingStatus.SUCCESS, ProcessingStatus.PARTIAL),
+            diagnostics=form_diagnostic,
+            success=form_diagnostic.status in _OK_STATUSES,
         )
 
+    def process_batch(
+        self,
+        form_responses: list[dict[str, Any]],
+        binding_spec: FormBindingSpec,
+        measures: dict[str, MeasureSpec],
+        deterministic_ids: bool = False,
+    ) -> list[ProcessingResult]:
+        """Process a batch of form responses against one spec pair.
+
+        Per-spec work (measure validation, normalized lookup structures)
+        is cached on the engines after the first submission, so the batch
+        loop pays only per-submission costs.
+
+        Args:
+            form_responses: Canonical form response dicts.
+            binding_spec: The form binding specification.
+            measures: Dict mapping measure_id to MeasureSpec.
+            deterministic_ids: If True, generate deterministic UUIDs (for testing).
+
+        Returns:
+            One ProcessingResult per form response, in input order.
+        """
+        process = self.process  # hoist the bound-method lookup out of the loop
+        return [
+            process(r, binding_spec, measures, deterministic_ids)
+            for r in form_responses
+        ]
+
+    def compile(
+        self,
+        binding_spec: FormBindingSpec,
+        measures: dict[str, MeasureSpec],
+    ) -> "CompiledQuestionnaireProcessor":
+        """Bind this processor to a fixed binding/measures pair.
+
+        Production deployments reuse one spec pair across many
+        submissions; the compiled processor validates the measures once
+        up front and closes over the specs so the per-submission call
+        carries only the form response.
+
+        Args:
+            binding_spec: The form binding specification.
+            measures: Dict mapping measure_id to MeasureSpec.
+
+        Returns:
+            A CompiledQuestionnaireProcessor for the spec pair.
+        """
+        return CompiledQuestionnaireProcessor(self, binding_spec, measures)
+
     def validate_measure(self, measure: MeasureSpec) -> list[str]:
         """Validate that a measure spec is compatible with questionnaire domain.
 
@@ -197,6 +242,13 @@ class QuestionnaireProcessor:
         Returns:
             List of validation error messages (empty if valid).
         """
+        # Specs are immutable once loaded from the registry, so the result
+        # for a given (measure_id, version) never changes within a batch
+        cache_key = (measure.measure_id, measure.version)
+        cached = self._validate_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         errors: list[str] = []
 
         # Check kind
@@ -205,6 +257,7 @@ class QuestionnaireProcessor:
                 f"Measure kind '{measure.kind}' is not supported by questionnaire domain. "
                 f"Supported kinds: {', '.join(self.SUPPORTED_KINDS)}"
             )
+            self._validate_cache[cache_key] = errors
             return errors  # No point checking further if kind is wrong
 
         # Questionnaires must have items
@@ -216,13 +269,63 @@ class QuestionnaireProcessor:
             if not item.response_map:
                 errors.append(f"Item {item.item_id} must have a response_map")
 
-        # Each scale must reference valid items
-        item_ids = {item.item_id for item in measure.items}
-        for scale in measure.scales:
-            for item_id in scale.items:
-                if item_id not in item_ids:
-                    errors.append(
-                        f"Scale {scale.scale_id} references unknown item: {item_id}"
-                    )
+        # Each scale must reference valid items. Only build the ID set when
+        # there are scales to check against it.
+        if measure.scales:
+            item_ids = {item.item_id for item in measure.items}
+            for scale in measure.scales:
+                for item_id in scale.items:
+                    if item_id not in item_ids:
+                        errors.append(
+                            f"Scale {scale.scale_id} references unknown item: {item_id}"
+                        )
 
+        self._validate_cache[cache_key] = errors
         return errors
+
+
+class CompiledQuestionnaireProcessor:
+    """A QuestionnaireProcessor bound to one binding/measures pair.
+
+    Created via QuestionnaireProcessor.compile(). Measure validation runs
+    once at construction; spec errors surface immediately instead of on
+    the first submission. process() then amortizes the fixed specs over
+    every call.
+    """
+
+    def __init__(
+        self,
+        processor: QuestionnaireProcessor,
+        binding_spec: FormBindingSpec,
+        measures: dict[str, MeasureSpec],
+    ) -> None:
+        """Bind the processor to the given specs, validating them once.
+
+        Raises:
+            ValueError: If any measure fails domain validation.
+        """
+        self._processor = processor
+        self._binding_spec = binding_spec
+        self._measures = measures
+
+        spec_errors: list[str] = []
+        for measure in measures.values():
+            spec_errors.extend(processor.validate_measure(measure))
+        if spec_errors:
+            raise ValueError(
+                f"Invalid measure spec(s) for binding {binding_spec.binding_id}: "
+                + "; ".join(spec_errors)
+            )
+
+    def process(
+        self,
+        form_response: dict[str, Any],
+        deterministic_ids: bool = False,
+    ) -> ProcessingResult:
+        """Process a form response against the bound specs."""
+        return self._processor.process(
+            form_response=form_response,
+            binding_spec=self._binding_spec,
+            measures=self._measures,
+            deterministic_ids=deterministic_ids,
+        )
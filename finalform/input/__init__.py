@@ -12,11 +12,13 @@ from finalform.input.process import (
     UnmappedFieldError,
     process_form_submission,
 )
+from finalform.input.sqlite_client import SqliteFormInputClient
 
 __all__ = [
     "FormInputClient",
     "MissingFormIdError",
     "MissingItemMapError",
+    "SqliteFormInputClient",
     "UnmappedFieldError",
     "process_form_submission",
 ]
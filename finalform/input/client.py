@@ -5,11 +5,18 @@ form fields correspond to which measure items. It's local, deterministic,
 and file-based.
 """
 
-import json
+import mmap
+import os
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+# Filesystem-unsafe characters in form IDs, mapped in one C-level pass
+_SAFE_TABLE = str.maketrans({"/": "_", ":": "_"})
+
 
 class FormInputClient:
     """Local helper for resolving form field -> item_id mappings.
@@ -30,12 +37,24 @@ class FormInputClient:
         # Resolution events log (append-only)
         self._events_path = self.storage_path / "_resolution_events.jsonl"
 
+        # Parsed-file caches invalidated by mtime, so repeated lookups for
+        # the same (form_id, measure_id) skip the open + parse
+        self._map_cache: dict[tuple[str, str], tuple[int, dict[str, str] | None]] = {}
+        self._list_cache: dict[str, tuple[int, list[str]]] = {}
+        self._created_at_cache: dict[tuple[str, str], str] = {}
+
+        # Form directories already created, so _get_mapping_path doesn't
+        # issue a mkdir syscall per call
+        self._ensured_dirs: set[Path] = set()
+
     def _get_mapping_path(self, form_id: str, measure_id: str) -> Path:
         """Get the path to a mapping file."""
         # Sanitize form_id for filesystem (replace problematic chars)
-        safe_form_id = form_id.replace("/", "_").replace(":", "_")
+        safe_form_id = form_id.translate(_SAFE_TABLE)
         form_dir = self.storage_path / safe_form_id
-        form_dir.mkdir(parents=True, exist_ok=True)
+        if form_dir not in self._ensured_dirs:
+            form_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(form_dir)
         return form_dir / f"{measure_id}.json"
 
     def get_item_map(
@@ -53,13 +72,25 @@ class FormInputClient:
             Dict mapping field_id to item_id, or None if not configured.
         """
         path = self._get_mapping_path(form_id, measure_id)
-        if not path.exists():
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
             return None
 
-        with open(path) as f:
-            data = json.load(f)
+        cache_key = (form_id, measure_id)
+        cached = self._map_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
 
-        return data.get("item_map", None)
+        item_map = data.get("item_map", None)
+        self._map_cache[cache_key] = (mtime_ns, item_map)
+        created_at = data.get("meta", {}).get("created_at")
+        if created_at:
+            self._created_at_cache[cache_key] = created_at
+        return item_map
 
     def save_item_map(
         self,
@@ -79,12 +110,16 @@ class FormInputClient:
         path = self._get_mapping_path(form_id, measure_id)
         now = datetime.now(timezone.utc).isoformat()
 
-        # Load existing to preserve created_at if it exists
-        created_at = now
-        if path.exists():
-            with open(path) as f:
-                existing = json.load(f)
-                created_at = existing.get("meta", {}).get("created_at", now)
+        # Preserve created_at, from the in-memory index when possible so
+        # repeat saves don't re-open and re-parse the existing file
+        cache_key = (form_id, measure_id)
+        created_at = self._created_at_cache.get(cache_key)
+        if created_at is None:
+            created_at = now
+            if path.exists():
+                with open(path, "rb") as f:
+                    existing = orjson.loads(f.read())
+                    created_at = existing.get("meta", {}).get("created_at", now)
 
         data = {
             "form_id": form_id,
@@ -96,8 +131,40 @@ class FormInputClient:
             },
         }
 
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data))
+
+        self._map_cache.pop(cache_key, None)
+        self._created_at_cache[cache_key] = created_at
+
+    def export_item_map(
+        self,
+        form_id: str,
+        measure_id: str,
+        path: Path | str,
+    ) -> bool:
+        """Write a pretty-printed copy of a stored mapping for human review.
+
+        Stored mapping files are compact; use this when an indented copy
+        is wanted for inspection or diffing.
+
+        Args:
+            form_id: The form identifier.
+            measure_id: The measure identifier.
+            path: Destination for the pretty-printed JSON.
+
+        Returns:
+            True if exported, False if no mapping exists.
+        """
+        source = self._get_mapping_path(form_id, measure_id)
+        if not source.exists():
+            return False
+
+        with open(source, "rb") as f:
+            data = orjson.loads(f.read())
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return True
 
     def list_mappings(self, form_id: str) -> list[str]:
         """List all measure_ids with mappings for a form.
@@ -108,12 +175,20 @@ class FormInputClient:
         Returns:
             List of measure_ids that have mappings configured.
         """
-        safe_form_id = form_id.replace("/", "_").replace(":", "_")
+        safe_form_id = form_id.translate(_SAFE_TABLE)
         form_dir = self.storage_path / safe_form_id
-        if not form_dir.exists():
+        try:
+            mtime_ns = os.stat(form_dir).st_mtime_ns
+        except FileNotFoundError:
             return []
 
-        return [f.stem for f in form_dir.glob("*.json") if not f.name.startswith("_")]
+        cached = self._list_cache.get(form_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        mappings = [f.stem for f in form_dir.glob("*.json") if not f.name.startswith("_")]
+        self._list_cache[form_id] = (mtime_ns, mappings)
+        return mappings
 
     def delete_item_map(
         self,
@@ -130,6 +205,8 @@ class FormInputClient:
             True if deleted, False if it didn't exist.
         """
         path = self._get_mapping_path(form_id, measure_id)
+        self._map_cache.pop((form_id, measure_id), None)
+        self._created_at_cache.pop((form_id, measure_id), None)
         if path.exists():
             path.unlink()
             return True
@@ -143,6 +220,7 @@ class FormInputClient:
         candidate_item_id: str,
         accepted: bool,
         reason: str | None = None,
+        timestamp: str | None = None,
     ) -> None:
         """Record a resolution event for future analysis.
 
@@ -155,9 +233,12 @@ class FormInputClient:
             candidate_item_id: The proposed item_id.
             accepted: Whether the resolution was accepted.
             reason: Optional reason for the decision.
+            timestamp: Optional ISO 8601 timestamp; callers replaying
+                many events can pass one shared value instead of paying
+                a datetime/isoformat per event.
         """
         event = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
             "form_id": form_id,
             "measure_id": measure_id,
             "field_id": field_id,
@@ -166,8 +247,96 @@ class FormInputClient:
             "reason": reason,
         }
 
-        with open(self._events_path, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        self.record_resolution_events([event])
+
+    def record_resolution_events(self, events: list[dict[str, Any]]) -> None:
+        """Append a batch of resolution events with a single write.
+
+        Serializes all events up front and issues one append, so bulk
+        resolution sessions pay one open/write/close instead of one per
+        event.
+
+        Events without a "timestamp" are stamped with a single shared
+        now, computed once for the whole batch.
+
+        Args:
+            events: Event dicts as built by record_resolution_event.
+        """
+        if not events:
+            return
+
+        now = None
+        for event in events:
+            if "timestamp" not in event:
+                if now is None:
+                    now = datetime.now(timezone.utc).isoformat()
+                event["timestamp"] = now
+
+        payload = b"".join(
+            orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE) for event in events
+        )
+        with open(self._events_path, "ab") as f:
+            f.write(payload)
+
+    def iter_resolution_events(
+        self,
+        form_id: str | None = None,
+        measure_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily yield resolution events, optionally filtered.
+
+        Streams the log without materializing all events, so large logs
+        can be consumed with flat memory.
+
+        Args:
+            form_id: Filter by form_id (optional).
+            measure_id: Filter by measure_id (optional).
+
+        Yields:
+            Matching resolution event dicts.
+        """
+        if not self._events_path.exists():
+            return
+
+        # A line that doesn't even contain the filter value as a raw byte
+        # substring can't match, so it can be skipped without parsing
+        needles = [value.encode() for value in (form_id, measure_id) if value]
+
+        # Compose the exact-match predicate once for the filters that are
+        # actually set, so the per-line loop doesn't re-test which filters
+        # apply on every event
+        if form_id and measure_id:
+            def keep(e: dict[str, Any]) -> bool:
+                return e.get("form_id") == form_id and e.get("measure_id") == measure_id
+        elif form_id:
+            def keep(e: dict[str, Any]) -> bool:
+                return e.get("form_id") == form_id
+        elif measure_id:
+            def keep(e: dict[str, Any]) -> bool:
+                return e.get("measure_id") == measure_id
+        else:
+            def keep(e: dict[str, Any]) -> bool:
+                return True
+
+        loads = orjson.loads
+
+        with open(self._events_path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                return
+
+            try:
+                for line in iter(mm.readline, b""):
+                    if not line.strip():
+                        continue
+                    if needles and any(needle not in line for needle in needles):
+                        continue
+                    event = loads(line)
+                    if keep(event):
+                        yield event
+            finally:
+                mm.close()
 
     def get_resolution_events(
         self,
@@ -183,18 +352,4 @@ class FormInputClient:
         Returns:
             List of resolution event dicts.
         """
-        if not self._events_path.exists():
-            return []
-
-        events = []
-        with open(self._events_path) as f:
-            for line in f:
-                if line.strip():
-                    event = json.loads(line)
-                    if form_id and event.get("form_id") != form_id:
-                        continue
-                    if measure_id and event.get("measure_id") != measure_id:
-                        continue
-                    events.append(event)
-
-        return events
+        return list(self.iter_resolution_events(form_id, measure_id))
@@ -115,28 +115,43 @@ def process_form_submission(
     internal_items = []
     unmapped_fields = []
 
-    for item in form_submission.get("items", []):
+    items = form_submission.get("items", ()) or ()
+
+    # Fail fast in strict mode with a cheap field_id pre-scan, so a
+    # misconfigured form doesn't pay for a full item build first
+    if strict:
+        missing = [
+            item["field_id"]
+            for item in items
+            if item.get("field_id") and item["field_id"] not in item_map
+        ]
+        if missing:
+            raise UnmappedFieldError(
+                f"Form contains fields not in item_map for measure {measure_id!r}: {missing}. "
+                f"Either add these fields to the item_map or set strict=False to skip them."
+            )
+
+    # Bind lookups to locals so the per-item loop skips repeated
+    # attribute resolution
+    map_get = item_map.get
+    items_append = internal_items.append
+    unmapped_append = unmapped_fields.append
+
+    for item in items:
         field_id = item.get("field_id")
         if not field_id:
             continue
 
-        item_id = item_map.get(field_id)
+        item_id = map_get(field_id)
         if item_id is None:
-            unmapped_fields.append(field_id)
-            continue  # Skip unmapped fields (will check strict below)
+            unmapped_append(field_id)  # Can't happen in strict mode (pre-scanned)
+            continue
 
-        internal_items.append({
+        items_append({
             "field_key": field_id,
             "answer": item.get("raw_value"),
         })
 
-    # Fail fast in strict mode if there are unmapped fields
-    if strict and unmapped_fields:
-        raise UnmappedFieldError(
-            f"Form contains fields not in item_map for measure {measure_id!r}: {unmapped_fields}. "
-            f"Either add these fields to the item_map or set strict=False to skip them."
-        )
-
     # Build internal form response
     internal_form_response = {
         "form_id": resolved_form_id,
@@ -146,18 +161,19 @@ def process_form_submission(
         "items": internal_items,
     }
 
-    # 5. Build binding spec for this single measure
-    binding_spec = FormBindingSpec(
+    # 5. Build binding spec for this single measure. The values all
+    # originate in-process from validated sources, so skip re-validation.
+    binding_spec = FormBindingSpec.model_construct(
         type="form_binding_spec",
         form_id=resolved_form_id,
         binding_id=f"_auto_{resolved_form_id}_{measure_id}",
         version="1.0.0",
         sections=[
-            BindingSection(
+            BindingSection.model_construct(
                 measure_id=measure_id,
                 measure_version=measure_spec.version,
                 bindings=[
-                    Binding(item_id=item_id, by="field_key", value=field_id)
+                    Binding.model_construct(item_id=item_id, by="field_key", value=field_id)
                     for field_id, item_id in item_map.items()
                 ],
             )
@@ -0,0 +1,275 @@
+"""SQLite-backed store for field_id -> item_id mappings.
+
+A drop-in alternative to FormInputClient that keeps every
+(form_id, measure_id) mapping and the resolution event log in a single
+database file instead of one JSON file per pair. At scale this avoids
+per-file opens, directory churn, and repeated JSON parsing: lookups are
+indexed SELECTs against one open connection.
+"""
+
+import sqlite3
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mappings (
+    form_id TEXT NOT NULL,
+    measure_id TEXT NOT NULL,
+    item_map BLOB NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (form_id, measure_id)
+);
+CREATE TABLE IF NOT EXISTS resolution_events (
+    timestamp TEXT NOT NULL,
+    form_id TEXT NOT NULL,
+    measure_id TEXT NOT NULL,
+    field_id TEXT NOT NULL,
+    candidate_item_id TEXT NOT NULL,
+    accepted INTEGER NOT NULL,
+    reason TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_form_measure
+    ON resolution_events (form_id, measure_id);
+"""
+
+
+class SqliteFormInputClient:
+    """FormInputClient-compatible store backed by a single SQLite file.
+
+    Mappings are stored as compact orjson blobs keyed by
+    (form_id, measure_id); no form_id sanitization is needed since IDs
+    never touch the filesystem.
+    """
+
+    def __init__(self, db_path: Path | str) -> None:
+        """Initialize the client.
+
+        Args:
+            db_path: Path to the SQLite database file. Parent directories
+                are created if needed.
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def get_item_map(
+        self,
+        form_id: str,
+        measure_id: str,
+    ) -> dict[str, str] | None:
+        """Return mapping field_id -> item_id for this (form_id, measure_id).
+
+        Args:
+            form_id: The form identifier.
+            measure_id: The measure identifier.
+
+        Returns:
+            Dict mapping field_id to item_id, or None if not configured.
+        """
+        row = self._conn.execute(
+            "SELECT item_map FROM mappings WHERE form_id = ? AND measure_id = ?",
+            (form_id, measure_id),
+        ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def save_item_map(
+        self,
+        form_id: str,
+        measure_id: str,
+        item_map: dict[str, str],
+    ) -> None:
+        """Persist mapping for this (form_id, measure_id).
+
+        Overwrites any existing mapping; created_at is preserved on
+        updates.
+
+        Args:
+            form_id: The form identifier.
+            measure_id: The measure identifier.
+            item_map: Dict mapping field_id to item_id.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        self._conn.execute(
+            "INSERT INTO mappings (form_id, measure_id, item_map, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (form_id, measure_id) DO UPDATE "
+            "SET item_map = excluded.item_map, updated_at = excluded.updated_at",
+            (form_id, measure_id, orjson.dumps(item_map), now, now),
+        )
+        self._conn.commit()
+
+    def list_mappings(self, form_id: str) -> list[str]:
+        """List all measure_ids with mappings for a form.
+
+        Args:
+            form_id: The form identifier.
+
+        Returns:
+            List of measure_ids that have mappings configured.
+        """
+        rows = self._conn.execute(
+            "SELECT measure_id FROM mappings WHERE form_id = ? ORDER BY measure_id",
+            (form_id,),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def delete_item_map(
+        self,
+        form_id: str,
+        measure_id: str,
+    ) -> bool:
+        """Delete a mapping.
+
+        Args:
+            form_id: The form identifier.
+            measure_id: The measure identifier.
+
+        Returns:
+            True if deleted, False if it didn't exist.
+        """
+        cursor = self._conn.execute(
+            "DELETE FROM mappings WHERE form_id = ? AND measure_id = ?",
+            (form_id, measure_id),
+        )
+        self._conn.commit()
+        return cursor.rowcount > 0
+
+    def record_resolution_event(
+        self,
+        form_id: str,
+        measure_id: str,
+        field_id: str,
+        candidate_item_id: str,
+        accepted: bool,
+        reason: str | None = None,
+        timestamp: str | None = None,
+    ) -> None:
+        """Record a resolution event for future analysis.
+
+        Args:
+            form_id: The form identifier.
+            measure_id: The measure identifier.
+            field_id: The form field being resolved.
+            candidate_item_id: The proposed item_id.
+            accepted: Whether the resolution was accepted.
+            reason: Optional reason for the decision.
+            timestamp: Optional ISO 8601 timestamp.
+        """
+        event = {
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
+            "form_id": form_id,
+            "measure_id": measure_id,
+            "field_id": field_id,
+            "candidate_item_id": candidate_item_id,
+            "accepted": accepted,
+            "reason": reason,
+        }
+        self.record_resolution_events([event])
+
+    def record_resolution_events(self, events: list[dict[str, Any]]) -> None:
+        """Append a batch of resolution events in a single transaction.
+
+        Events without a "timestamp" are stamped with a single shared
+        now, matching the JSONL-backed client.
+
+        Args:
+            events: Event dicts as built by record_resolution_event.
+        """
+        if not events:
+            return
+
+        now = None
+        rows = []
+        for event in events:
+            timestamp = event.get("timestamp")
+            if timestamp is None:
+                if now is None:
+                    now = datetime.now(timezone.utc).isoformat()
+                timestamp = now
+            rows.append(
+                (
+                    timestamp,
+                    event["form_id"],
+                    event["measure_id"],
+                    event["field_id"],
+                    event["candidate_item_id"],
+                    1 if event["accepted"] else 0,
+                    event.get("reason"),
+                )
+            )
+
+        self._conn.executemany(
+            "INSERT INTO resolution_events "
+            "(timestamp, form_id, measure_id, field_id, candidate_item_id, accepted, reason) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._conn.commit()
+
+    def iter_resolution_events(
+        self,
+        form_id: str | None = None,
+        measure_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily yield resolution events, optionally filtered.
+
+        Args:
+            form_id: Filter by form_id (optional).
+            measure_id: Filter by measure_id (optional).
+
+        Yields:
+            Matching resolution event dicts.
+        """
+        query = (
+            "SELECT timestamp, form_id, measure_id, field_id, "
+            "candidate_item_id, accepted, reason FROM resolution_events"
+        )
+        clauses = []
+        params: list[str] = []
+        if form_id:
+            clauses.append("form_id = ?")
+            params.append(form_id)
+        if measure_id:
+            clauses.append("measure_id = ?")
+            params.append(measure_id)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY rowid"
+
+        for row in self._conn.execute(query, params):
+            yield {
+                "timestamp": row[0],
+                "form_id": row[1],
+                "measure_id": row[2],
+                "field_id": row[3],
+                "candidate_item_id": row[4],
+                "accepted": bool(row[5]),
+                "reason": row[6],
+            }
+
+    def get_resolution_events(
+        self,
+        form_id: str | None = None,
+        measure_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Retrieve resolution events, optionally filtered.
+
+        Args:
+            form_id: Filter by form_id (optional).
+            measure_id: Filter by measure_id (optional).
+
+        Returns:
+            List of resolution event dicts.
+        """
+        return list(self.iter_resolution_events(form_id, measure_id))
@@ -3,7 +3,10 @@
 Looks up interpretation labels from the measure spec based on score ranges.
 """
 
-from pydantic import BaseModel
+from bisect import bisect_right
+from typing import Any
+
+from pydantic import BaseModel, PrivateAttr
 
 from finalform.registry.models import MeasureSpec
 from finalform.scoring.engine import ScaleScore, ScoringResult
@@ -28,12 +31,14 @@ class InterpretationResult(BaseModel):
     measure_version: str
     scores: list[InterpretedScore]
 
+    # Lazy scale_id index so repeated lookups aren't linear scans
+    _by_id: dict[str, InterpretedScore] | None = PrivateAttr(default=None)
+
     def get_score(self, scale_id: str) -> InterpretedScore | None:
         """Get an interpreted score by scale ID."""
-        for score in self.scores:
-            if score.scale_id == scale_id:
-                return score
-        return None
+        if self._by_id is None:
+            self._by_id = {score.scale_id: score for score in self.scores}
+        return self._by_id.get(scale_id)
 
 
 class Interpreter:
@@ -43,6 +48,39 @@ class Interpreter:
     and matches scale scores to their corresponding labels.
     """
 
+    def __init__(self) -> None:
+        """Initialize the interpreter."""
+        # Per-scale bands sorted by min boundary, keyed by
+        # (measure_id, version, scale_id); specs are immutable so the
+        # sorted view is built once
+        self._band_cache: dict[tuple[str, str, str], tuple[list[float], list[Any]]] = {}
+
+    def _find_band(
+        self,
+        measure: MeasureSpec,
+        scale_spec: Any,
+        value: float,
+    ) -> Any | None:
+        """Find the interpretation band containing value, or None.
+
+        Uses a bisect over min boundaries sorted once per scale instead
+        of a linear scan of the band list on every lookup.
+        """
+        cache_key = (measure.measure_id, measure.version, scale_spec.scale_id)
+        cached = self._band_cache.get(cache_key)
+        if cached is None:
+            bands = sorted(scale_spec.interpretations, key=lambda b: b.min)
+            cached = ([b.min for b in bands], bands)
+            self._band_cache[cache_key] = cached
+
+        mins, bands = cached
+        idx = bisect_right(mins, value) - 1
+        if idx >= 0:
+            band = bands[idx]
+            if value <= band.max:
+                return band
+        return None
+
     def interpret(
         self,
         scoring_result: ScoringResult,
@@ -77,7 +115,7 @@ class Interpreter:
         """Interpret a single scale score."""
         # If no value, can't interpret
         if scale_score.value is None:
-            return InterpretedScore(
+            return InterpretedScore.model_construct(
                 scale_id=scale_score.scale_id,
                 name=scale_score.name,
                 value=None,
@@ -88,7 +126,7 @@ class Interpreter:
         # Get scale spec
         scale_spec = measure.get_scale(scale_score.scale_id)
         if scale_spec is None:
-            return InterpretedScore(
+            return InterpretedScore.model_construct(
                 scale_id=scale_score.scale_id,
                 name=scale_score.name,
                 value=scale_score.value,
@@ -98,20 +136,20 @@ class Interpreter:
 
         # Find matching interpretation range
         score_value = scale_score.value
-        for interp in scale_spec.interpretations:
-            if interp.min <= score_value <= interp.max:
-                return InterpretedScore(
-                    scale_id=scale_score.scale_id,
-                    name=scale_score.name,
-                    value=score_value,
-                    label=interp.label,
-                    interpretation_min=interp.min,
-                    interpretation_max=interp.max,
-                    error=None,
-                )
+        interp = self._find_band(measure, scale_spec, score_value)
+        if interp is not None:
+            return InterpretedScore.model_construct(
+                scale_id=scale_score.scale_id,
+                name=scale_score.name,
+                value=score_value,
+                label=interp.label,
+                interpretation_min=interp.min,
+                interpretation_max=interp.max,
+                error=None,
+            )
 
         # No matching range found
-        return InterpretedScore(
+        return InterpretedScore.model_construct(
             scale_id=scale_score.scale_id,
             name=scale_score.name,
             value=score_value,
@@ -155,8 +193,5 @@ class Interpreter:
         if scale_spec is None:
             return None
 
-        for interp in scale_spec.interpretations:
-            if interp.min <= value <= interp.max:
-                return interp.label
-
-        return None
+        interp = self._find_band(measure, scale_spec, value)
+        return interp.label if interp is not None else None
@@ -1,10 +1,11 @@
 """Input/output utilities for reading and writing JSONL files."""
 
-import json
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 
 def read_jsonl(path: Path | str) -> Iterator[dict[str, Any]]:
     """Read a JSONL file and yield each record.
@@ -15,14 +16,14 @@ def read_jsonl(path: Path | str) -> Iterator[dict[str, Any]]:
     Yields:
         Each parsed JSON record.
     """
-    with open(path) as f:
+    with open(path, "rb") as f:
         for line_num, line in enumerate(f, 1):
             line = line.strip()
             if not line:
                 continue
             try:
-                yield json.loads(line)
-            except json.JSONDecodeError as e:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON on line {line_num}: {e}") from e
 
 
@@ -36,9 +37,9 @@ def write_jsonl(path: Path | str, records: Iterator[dict[str, Any]] | list[dict[
     Returns:
         Number of records written.
     """
-    count = 0
-    with open(path, "w") as f:
-        for record in records:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
-            count += 1
-    return count
+    # Serialize everything first and issue one write, so the file sees a
+    # single syscall instead of one per record
+    lines = [orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE) for record in records]
+    with open(path, "wb") as f:
+        f.write(b"".join(lines))
+    return len(lines)
@@ -56,6 +56,129 @@ class Mapper:
     - Does not interpret question text or guess mappings
     """
 
+    def __init__(self) -> None:
+        """Initialize the mapper."""
+        # Flattened binding plans keyed by (binding_id, version); specs are
+        # immutable once loaded, so the plan is built once per spec
+        self._binding_cache: dict[
+            tuple[str, str], list[tuple[str, str, list[tuple[str, Any, str]]]]
+        ] = {}
+        # Specialized plans for the common shape built by
+        # process_form_submission: exactly one section, all bindings by
+        # field_key. None marks specs that don't fit the fast path.
+        self._single_cache: dict[
+            tuple[str, str],
+            tuple[str, str, list[tuple[str, Any, str]], frozenset[str]] | None,
+        ] = {}
+
+    def _binding_plan(
+        self,
+        binding_spec: FormBindingSpec,
+    ) -> list[tuple[str, str, list[tuple[str, Any, str]]]]:
+        """Flatten a binding spec into plain lookup tuples.
+
+        Returns one (measure_id, measure_version, bindings) entry per
+        section, where each binding is a (by, value, item_id) tuple with
+        the value already converted for dict lookup.
+        """
+        cache_key = (binding_spec.binding_id, binding_spec.version)
+        plan = self._binding_cache.get(cache_key)
+        if plan is None:
+            plan = []
+            for section in binding_spec.sections:
+                bindings: list[tuple[str, Any, str]] = []
+                for binding in section.bindings:
+                    if binding.by == "field_key":
+                        bindings.append(("field_key", str(binding.value), binding.item_id))
+                    else:
+                        bindings.append(("position", int(binding.value), binding.item_id))
+                plan.append((section.measure_id, section.measure_version, bindings))
+            self._binding_cache[cache_key] = plan
+        return plan
+
+    def _single_section_plan(
+        self,
+        binding_spec: FormBindingSpec,
+    ) -> tuple[str, str, list[tuple[str, Any, str]], frozenset[str]] | None:
+        """Return a specialized plan for single-section field_key specs.
+
+        Returns (measure_id, measure_version, bindings, bound_keys) when
+        the spec has exactly one section bound entirely by field_key,
+        else None. bound_keys lets the fast path compute unmapped fields
+        without tracking used keys per item.
+        """
+        cache_key = (binding_spec.binding_id, binding_spec.version)
+        if cache_key in self._single_cache:
+            return self._single_cache[cache_key]
+
+        plan = self._binding_plan(binding_spec)
+        single = None
+        if len(plan) == 1:
+            measure_id, measure_version, bindings = plan[0]
+            if all(by == "field_key" for by, _, _ in bindings):
+                bound_keys = frozenset(value for _, value, _ in bindings)
+                single = (measure_id, measure_version, bindings, bound_keys)
+        self._single_cache[cache_key] = single
+        return single
+
+    def _map_single_section(
+        self,
+        form_response: dict[str, Any],
+        plan: tuple[str, str, list[tuple[str, Any, str]], frozenset[str]],
+    ) -> MappingResult:
+        """Fast path for single-section, field_key-only binding specs.
+
+        Skips the position index, per-item used-key bookkeeping, and the
+        section loop of the general path.
+        """
+        measure_id, measure_version, bindings, bound_keys = plan
+
+        items_by_field_key: dict[str, dict[str, Any]] = {}
+        for item in form_response.get("items", []):
+            if "field_key" in item:
+                items_by_field_key[item["field_key"]] = item
+
+        mapped_items: list[MappedItem] = []
+        lookup = items_by_field_key.get
+        append = mapped_items.append
+        construct = MappedItem.model_construct
+
+        for _, value, item_id in bindings:
+            form_item = lookup(value)
+            if form_item is None:
+                continue
+            append(
+                construct(
+                    measure_id=measure_id,
+                    measure_version=measure_version,
+                    item_id=item_id,
+                    raw_answer=form_item.get("answer", form_item.get("value")),
+                    field_key=value,
+                    position=form_item.get("position"),
+                )
+            )
+
+        sections = (
+            [
+                MappedSection(
+                    measure_id=measure_id,
+                    measure_version=measure_version,
+                    items=mapped_items,
+                )
+            ]
+            if mapped_items
+            else []
+        )
+
+        return MappingResult(
+            form_id=form_response.get("form_id", ""),
+            form_submission_id=form_response.get("form_submission_id", ""),
+            subject_id=form_response.get("subject_id", ""),
+            timestamp=form_response.get("timestamp", ""),
+            sections=sections,
+            unmapped_fields=[k for k in items_by_field_key if k not in bound_keys],
+        )
+
     def map(
         self,
         form_response: dict[str, Any],
@@ -73,6 +196,12 @@ class Mapper:
         Raises:
             MappingError: If a required form field is not found.
         """
+        # Specialize for the common single-section, field_key-only shape
+        # (what process_form_submission always builds)
+        single = self._single_section_plan(binding_spec)
+        if single is not None:
+            return self._map_single_section(form_response, single)
+
         # Extract form metadata
         form_id = form_response.get("form_id", "")
         form_submission_id = form_response.get("form_submission_id", "")
@@ -93,23 +222,19 @@ class Mapper:
         sections: list[MappedSection] = []
         used_field_keys: set[str] = set()
 
-        for section in binding_spec.sections:
+        for measure_id, measure_version, bindings in self._binding_plan(binding_spec):
             mapped_items: list[MappedItem] = []
 
-            for binding in section.bindings:
-                form_item: dict[str, Any] | None = None
-
-                if binding.by == "field_key":
-                    field_key = str(binding.value)
-                    form_item = items_by_field_key.get(field_key)
+            for by, value, item_id in bindings:
+                if by == "field_key":
+                    form_item = items_by_field_key.get(value)
                     if form_item is None:
                         # Section is incomplete but continue processing other items
                         continue
-                    used_field_keys.add(field_key)
+                    used_field_keys.add(value)
 
-                elif binding.by == "position":
-                    position = int(binding.value)
-                    form_item = items_by_position.get(position)
+                else:  # by == "position"
+                    form_item = items_by_position.get(value)
                     if form_item is None:
                         # Section is incomplete but continue processing other items
                         continue
@@ -120,10 +245,10 @@ class Mapper:
                 raw_answer = form_item.get("answer", form_item.get("value"))
 
                 mapped_items.append(
-                    MappedItem(
-                        measure_id=section.measure_id,
-                        measure_version=section.measure_version,
-                        item_id=binding.item_id,
+                    MappedItem.model_construct(
+                        measure_id=measure_id,
+                        measure_version=measure_version,
+                        item_id=item_id,
                         raw_answer=raw_answer,
                         field_key=form_item.get("field_key"),
                         position=form_item.get("position"),
@@ -134,15 +259,16 @@ class Mapper:
             if mapped_items:
                 sections.append(
                     MappedSection(
-                        measure_id=section.measure_id,
-                        measure_version=section.measure_version,
+                        measure_id=measure_id,
+                        measure_version=measure_version,
                         items=mapped_items,
                     )
                 )
 
-        # Track unmapped fields
-        all_field_keys = set(items_by_field_key.keys())
-        unmapped_fields = list(all_field_keys - used_field_keys)
+        # Track unmapped fields in one pass over the index instead of
+        # materializing a second set for the difference; dict order also
+        # makes the output deterministic (form order)
+        unmapped_fields = [k for k in items_by_field_key if k not in used_field_keys]
 
         return MappingResult(
             form_id=form_id,
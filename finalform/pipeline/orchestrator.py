@@ -4,6 +4,7 @@ Loads registries, resolves specs, and routes to the appropriate
 domain processor based on measure kind.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +27,7 @@ class PipelineConfig(BaseModel):
     measure_schema_path: Path | None = None
     binding_schema_path: Path | None = None
     deterministic_ids: bool = False
+    max_workers: int | None = None
 
 
 class Pipeline:
@@ -84,5 +86,15 @@ class Pipeline:
         )
 
     def process_batch(self, form_responses: list[dict[str, Any]]) -> list[ProcessingResult]:
-        """Process a batch of form responses."""
+        """Process a batch of form responses.
+
+        With config.max_workers set, submissions are processed on a
+        thread pool (results stay in input order); otherwise serially.
+        For process-level parallelism use the CLI's --workers option,
+        which preloads the pipeline per worker process.
+        """
+        max_workers = self.config.max_workers
+        if max_workers and max_workers > 1 and len(form_responses) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(self.process, form_responses))
         return [self.process(r) for r in form_responses]
@@ -5,9 +5,10 @@ response_map. It does not perform fuzzy matching - text must match exactly
 (after normalization and alias resolution).
 """
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, model_validator
 
 from finalform.mapping.mapper import MappedItem, MappedSection, MappingResult
 from finalform.registry.models import MeasureSpec
@@ -19,6 +20,21 @@ class RecodingError(Exception):
     pass
 
 
+def value_type_of(value: int | float | str | None) -> Literal["integer", "float", "string", "null"]:
+    """Classify a value for observation output.
+
+    Whole-number floats are reported as "integer" to match the
+    observation contract.
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, float):
+        return "integer" if value.is_integer() else "float"
+    if isinstance(value, str):
+        return "string"
+    return "integer"
+
+
 class RecodedItem(BaseModel):
     """A recoded item with numeric value."""
 
@@ -30,6 +46,17 @@ class RecodedItem(BaseModel):
     missing: bool = False
     field_key: str | None = None
     position: int | None = None
+    value_type: Literal["integer", "float", "string", "null"] | None = None
+    # True when the recoder already range-checked the value against the
+    # response map, letting downstream validation skip the re-check
+    validated: bool = False
+
+    @model_validator(mode="after")
+    def _derive_value_type(self) -> "RecodedItem":
+        """Classify the value once at construction time."""
+        if self.value_type is None:
+            self.value_type = value_type_of(self.value)
+        return self
 
 
 class RecodedSection(BaseModel):
@@ -38,6 +65,23 @@ class RecodedSection(BaseModel):
     measure_id: str
     measure_version: str
     items: list[RecodedItem]
+    items_present: int | None = None
+
+    # Lazy item_id index for per-scale lookups
+    _items_by_id: dict[str, RecodedItem] | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _count_present(self) -> "RecodedSection":
+        """Count non-missing items once at construction time."""
+        if self.items_present is None:
+            self.items_present = sum(1 for i in self.items if not i.missing)
+        return self
+
+    def items_by_id(self) -> dict[str, RecodedItem]:
+        """Recoded items indexed by item_id, built once per section."""
+        if self._items_by_id is None:
+            self._items_by_id = {item.item_id: item for item in self.items}
+        return self._items_by_id
 
 
 class RecodingResult(BaseModel):
@@ -59,6 +103,20 @@ class Recoder:
     - No fuzzy matching or guessing
     """
 
+    # Bound on the per-item answer memo so adversarial inputs (many
+    # distinct numeric strings) can't grow it without limit
+    _RECODE_CACHE_MAX = 1024
+
+    def __init__(self, max_workers: int = 1) -> None:
+        """Initialize the recoder.
+
+        Args:
+            max_workers: Recode sections on a thread pool when > 1;
+                the default keeps recoding sequential. Only forms with
+                several measures benefit.
+        """
+        self.max_workers = max_workers
+
     def recode(
         self,
         mapping_result: MappingResult,
@@ -76,9 +134,7 @@ class Recoder:
         Raises:
             RecodingError: If a text value cannot be recoded.
         """
-        sections: list[RecodedSection] = []
-
-        for mapped_section in mapping_result.sections:
+        def recode_one(mapped_section: MappedSection) -> RecodedSection:
             measure = measures.get(mapped_section.measure_id)
             if measure is None:
                 raise RecodingError(
@@ -86,15 +142,22 @@ class Recoder:
                 )
 
             recoded_items = self._recode_section(mapped_section, measure)
-            sections.append(
-                RecodedSection(
-                    measure_id=mapped_section.measure_id,
-                    measure_version=mapped_section.measure_version,
-                    items=recoded_items,
-                )
+            return RecodedSection.model_construct(
+                measure_id=mapped_section.measure_id,
+                measure_version=mapped_section.measure_version,
+                items=recoded_items,
+                items_present=sum(1 for i in recoded_items if not i.missing),
             )
 
-        return RecodingResult(
+        mapped_sections = mapping_result.sections
+        if self.max_workers > 1 and len(mapped_sections) > 1:
+            # Sections are independent; pool.map preserves input order
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                sections = list(pool.map(recode_one, mapped_sections))
+        else:
+            sections = [recode_one(s) for s in mapped_sections]
+
+        return RecodingResult.model_construct(
             form_id=mapping_result.form_id,
             form_submission_id=mapping_result.form_submission_id,
             subject_id=mapping_result.subject_id,
@@ -108,13 +171,10 @@ class Recoder:
         measure: MeasureSpec,
     ) -> list[RecodedItem]:
         """Recode all items in a section."""
-        recoded_items: list[RecodedItem] = []
-
-        for mapped_item in section.items:
-            recoded_item = self._recode_item(mapped_item, measure)
-            recoded_items.append(recoded_item)
-
-        return recoded_items
+        # Comprehension sizes the result list from the input's length
+        # hint, avoiding append-driven reallocations
+        recode_item = self._recode_item
+        return [recode_item(mapped_item, measure) for mapped_item in section.items]
 
     def _recode_item(
         self,
@@ -149,15 +209,20 @@ class Recoder:
                 f"{type(raw_answer).__name__}"
             )
 
-        return RecodedItem(
-            measure_id=mapped_item.measure_id,
+        # model_construct skips validation; the derived value_type is
+        # set explicitly since the post-validator won't run. IDs are
+        # taken from the spec so recoded items carry the interned copies.
+        return RecodedItem.model_construct(
+            measure_id=measure.measure_id,
             measure_version=mapped_item.measure_version,
-            item_id=mapped_item.item_id,
+            item_id=item_spec.item_id,
             value=value,
             raw_answer=raw_answer,
             missing=missing,
             field_key=mapped_item.field_key,
             position=mapped_item.position,
+            value_type=value_type_of(value),
+            validated=not missing,
         )
 
     def _validate_numeric(
@@ -167,10 +232,9 @@ class Recoder:
         item_id: str,
     ) -> int | float:
         """Validate a numeric value against the response map range."""
-        # Get valid range from response_map values
-        valid_values = list(item_spec.response_map.values())
-        min_val = min(valid_values)
-        max_val = max(valid_values)
+        # Range bounds are precomputed at spec load
+        min_val = item_spec._min_value
+        max_val = item_spec._max_value
 
         if not (min_val <= value <= max_val):
             raise RecodingError(
@@ -186,37 +250,44 @@ class Recoder:
         item_id: str,
     ) -> int:
         """Recode a string answer to a numeric value."""
+        # Repeated answers ("0", "Not at all", ...) hit the per-item
+        # memo and skip parsing entirely; failures are never cached so
+        # error paths stay exact
+        cache = item_spec._recode_cache
+        hit = cache.get(raw_answer)
+        if hit is not None:
+            return hit
+
         # Try to parse as numeric first
         try:
             numeric = float(raw_answer)
-            if numeric.is_integer():
-                numeric = int(numeric)
-            return self._validate_numeric(numeric, item_spec, item_id)
         except ValueError:
             pass
-
-        # Normalize: lowercase and strip whitespace
+        else:
+            if numeric.is_integer():
+                numeric = int(numeric)
+            value = self._validate_numeric(numeric, item_spec, item_id)
+            if len(cache) < self._RECODE_CACHE_MAX:
+                cache[raw_answer] = value
+            return value
+
+        # Normalize once: lowercase and strip whitespace. Alias keys and
+        # values are pre-normalized at spec load, so resolution is a
+        # single dict get with no further string passes.
         normalized = raw_answer.lower().strip()
+        normalized = item_spec._aliases_lower.get(normalized, normalized)
 
-        # Check aliases first to resolve to canonical text (case-insensitive)
-        if item_spec.aliases:
-            # Build lowercase alias map for case-insensitive lookup
-            aliases_lower = {k.lower().strip(): v for k, v in item_spec.aliases.items()}
-            if normalized in aliases_lower:
-                canonical = aliases_lower[normalized]
-                normalized = canonical.lower().strip()
-
-        # Build lowercase response map for lookup
-        response_map_lower = {k.lower().strip(): v for k, v in item_spec.response_map.items()}
-
-        if normalized not in response_map_lower:
+        value = item_spec._response_map_lower.get(normalized)
+        if value is None:
             valid_responses = list(item_spec.response_map.keys())
             raise RecodingError(
                 f"Unknown response '{raw_answer}' for item {item_id}. "
                 f"Valid responses: {valid_responses}"
             )
 
-        return response_map_lower[normalized]
+        if len(cache) < self._RECODE_CACHE_MAX:
+            cache[raw_answer] = value
+        return value
 
     def recode_section(
         self,
@@ -233,8 +304,9 @@ class Recoder:
             RecodedSection with numeric values.
         """
         recoded_items = self._recode_section(mapped_section, measure)
-        return RecodedSection(
+        return RecodedSection.model_construct(
             measure_id=mapped_section.measure_id,
             measure_version=mapped_section.measure_version,
             items=recoded_items,
+            items_present=sum(1 for i in recoded_items if not i.missing),
         )
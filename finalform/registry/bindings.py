@@ -1,9 +1,9 @@
 """Binding registry for loading and caching form binding specifications."""
 
-import json
 from pathlib import Path
 
 import jsonschema
+import orjson
 
 from finalform.registry.models import FormBindingSpec
 
@@ -44,10 +44,19 @@ class BindingRegistry:
         self.bindings_path = self.registry_path / "bindings"
         self._cache: dict[tuple[str, str], FormBindingSpec] = {}
         self._schema: dict | None = None
+        self._validator: jsonschema.Draft202012Validator | None = None
+
+        # Directory listings memoized by mtime so repeated list/get_latest
+        # calls don't re-glob unchanged directories
+        self._bindings_cache: tuple[int, list[str]] | None = None
+        self._versions_cache: dict[str, tuple[int, list[str]]] = {}
 
         if schema_path:
-            with open(schema_path) as f:
-                self._schema = json.load(f)
+            with open(schema_path, "rb") as f:
+                self._schema = orjson.loads(f.read())
+            # Compile the schema once; per-spec validation then skips
+            # meta-schema processing and ref resolution
+            self._validator = jsonschema.Draft202012Validator(self._schema)
 
     def _version_to_filename(self, version: str) -> str:
         """Convert version string to filename (1.0.0 -> 1-0-0.json)."""
@@ -83,39 +92,59 @@ class BindingRegistry:
                 f"(expected at {spec_path})"
             )
 
-        with open(spec_path) as f:
-            data = json.load(f)
+        raw = spec_path.read_bytes()
 
-        # Validate against schema if available
-        if self._schema:
+        # Validate against schema if available; without one, pydantic
+        # parses the JSON and validates in a single pass with no
+        # intermediate dict
+        if self._validator:
+            data = orjson.loads(raw)
             try:
-                jsonschema.validate(data, self._schema)
+                self._validator.validate(data)
             except jsonschema.ValidationError as e:
                 raise BindingValidationError(
                     f"Binding spec validation failed for {binding_id}@{version}: {e.message}"
                 ) from e
-
-        spec = FormBindingSpec.model_validate(data)
+            spec = FormBindingSpec.model_validate(data)
+        else:
+            spec = FormBindingSpec.model_validate_json(raw)
         self._cache[cache_key] = spec
         return spec
 
     def list_bindings(self) -> list[str]:
         """List all available binding IDs."""
-        if not self.bindings_path.exists():
+        try:
+            mtime_ns = self.bindings_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
-        return [d.name for d in self.bindings_path.iterdir() if d.is_dir()]
+
+        if self._bindings_cache is not None and self._bindings_cache[0] == mtime_ns:
+            return self._bindings_cache[1]
+
+        bindings = [d.name for d in self.bindings_path.iterdir() if d.is_dir()]
+        self._bindings_cache = (mtime_ns, bindings)
+        return bindings
 
     def list_versions(self, binding_id: str) -> list[str]:
         """List all available versions for a binding."""
         binding_path = self.bindings_path / binding_id
-        if not binding_path.exists():
+        try:
+            mtime_ns = binding_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
+
+        cached = self._versions_cache.get(binding_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         versions = []
         for f in binding_path.glob("*.json"):
             # Convert filename back to version (1-0-0.json -> 1.0.0)
             version = f.stem.replace("-", ".")
             versions.append(version)
-        return sorted(versions)
+        versions = sorted(versions)
+        self._versions_cache[binding_id] = (mtime_ns, versions)
+        return versions
 
     def get_latest(self, binding_id: str) -> FormBindingSpec:
         """Get the latest version of a binding.
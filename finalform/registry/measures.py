@@ -1,9 +1,9 @@
 """Measure registry for loading and caching measure specifications."""
 
-import json
 from pathlib import Path
 
 import jsonschema
+import orjson
 
 from finalform.registry.models import MeasureSpec
 
@@ -44,10 +44,19 @@ class MeasureRegistry:
         self.measures_path = self.registry_path / "measures"
         self._cache: dict[tuple[str, str], MeasureSpec] = {}
         self._schema: dict | None = None
+        self._validator: jsonschema.Draft202012Validator | None = None
+
+        # Directory listings memoized by mtime so repeated list/get_latest
+        # calls don't re-glob unchanged directories
+        self._measures_cache: tuple[int, list[str]] | None = None
+        self._versions_cache: dict[str, tuple[int, list[str]]] = {}
 
         if schema_path:
-            with open(schema_path) as f:
-                self._schema = json.load(f)
+            with open(schema_path, "rb") as f:
+                self._schema = orjson.loads(f.read())
+            # Compile the schema once; per-spec validation then skips
+            # meta-schema processing and ref resolution
+            self._validator = jsonschema.Draft202012Validator(self._schema)
 
     def _version_to_filename(self, version: str) -> str:
         """Convert version string to filename (1.0.0 -> 1-0-0.json)."""
@@ -83,39 +92,59 @@ class MeasureRegistry:
                 f"(expected at {spec_path})"
             )
 
-        with open(spec_path) as f:
-            data = json.load(f)
+        raw = spec_path.read_bytes()
 
-        # Validate against schema if available
-        if self._schema:
+        # Validate against schema if available; without one, pydantic
+        # parses the JSON and validates in a single pass with no
+        # intermediate dict
+        if self._validator:
+            data = orjson.loads(raw)
             try:
-                jsonschema.validate(data, self._schema)
+                self._validator.validate(data)
             except jsonschema.ValidationError as e:
                 raise MeasureValidationError(
                     f"Measure spec validation failed for {measure_id}@{version}: {e.message}"
                 ) from e
-
-        spec = MeasureSpec.model_validate(data)
+            spec = MeasureSpec.model_validate(data)
+        else:
+            spec = MeasureSpec.model_validate_json(raw)
         self._cache[cache_key] = spec
         return spec
 
     def list_measures(self) -> list[str]:
         """List all available measure IDs."""
-        if not self.measures_path.exists():
+        try:
+            mtime_ns = self.measures_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
-        return [d.name for d in self.measures_path.iterdir() if d.is_dir()]
+
+        if self._measures_cache is not None and self._measures_cache[0] == mtime_ns:
+            return self._measures_cache[1]
+
+        measures = [d.name for d in self.measures_path.iterdir() if d.is_dir()]
+        self._measures_cache = (mtime_ns, measures)
+        return measures
 
     def list_versions(self, measure_id: str) -> list[str]:
         """List all available versions for a measure."""
         measure_path = self.measures_path / measure_id
-        if not measure_path.exists():
+        try:
+            mtime_ns = measure_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
+
+        cached = self._versions_cache.get(measure_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         versions = []
         for f in measure_path.glob("*.json"):
             # Convert filename back to version (1-0-0.json -> 1.0.0)
             version = f.stem.replace("-", ".")
             versions.append(version)
-        return sorted(versions)
+        versions = sorted(versions)
+        self._versions_cache[measure_id] = (mtime_ns, versions)
+        return versions
 
     def get_latest(self, measure_id: str) -> MeasureSpec:
         """Get the latest version of a measure.
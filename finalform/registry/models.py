@@ -1,8 +1,9 @@
 """Pydantic models for measure and binding specifications."""
 
-from typing import Literal
+import sys
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 class Interpretation(BaseModel):
@@ -29,6 +30,24 @@ class MeasureScale(BaseModel):
     missing_strategy: Literal["fail", "skip", "prorate"] = "fail"
     interpretations: list[Interpretation]
 
+    # Derived scoring metadata: the reversed-item set is computed here;
+    # the response range is stamped by MeasureSpec once items are known
+    # (None until then, so scoring can tell "unstamped" from a real 0)
+    _reversed_set: frozenset[str] = PrivateAttr(default=frozenset())
+    _min_value: int | None = PrivateAttr(default=None)
+    _max_value: int | None = PrivateAttr(default=None)
+    # Scoring kernels bound lazily by the scoring engine (can't be set
+    # here without importing scoring and creating a cycle)
+    _score_fn: Any = PrivateAttr(default=None)
+    _prorate_fn: Any = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _index_reversed(self) -> "MeasureScale":
+        """Precompute the reversed-item set for O(1) membership tests."""
+        if self.reversed_items:
+            self._reversed_set = frozenset(self.reversed_items)
+        return self
+
 
 class MeasureItem(BaseModel):
     """Item (question) definition within a measure."""
@@ -39,6 +58,39 @@ class MeasureItem(BaseModel):
     response_map: dict[str, int]
     aliases: dict[str, str] = Field(default_factory=dict)
 
+    # Derived response metadata, computed once at spec load so the
+    # recoding/validation hot paths don't rebuild lists or lowercase
+    # maps per item. response_map/aliases stay untouched for
+    # serialization.
+    _min_value: int = PrivateAttr(default=0)
+    _max_value: int = PrivateAttr(default=0)
+    _response_map_lower: dict[str, int] = PrivateAttr(default_factory=dict)
+    _aliases_lower: dict[str, str] = PrivateAttr(default_factory=dict)
+    # Memo of successfully recoded raw strings, filled by the recoder;
+    # repeated answers skip parsing and normalization entirely
+    _recode_cache: dict[str, int | float] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _index_responses(self) -> "MeasureItem":
+        """Precompute range bounds and normalized lookup maps."""
+        if self.response_map:
+            values = self.response_map.values()
+            self._min_value = min(values)
+            self._max_value = max(values)
+            # Keys are interned: response texts repeat across items, so
+            # equal strings share storage and dict gets hit the pointer
+            # equality fast path
+            self._response_map_lower = {
+                sys.intern(k.lower().strip()): v for k, v in self.response_map.items()
+            }
+        if self.aliases:
+            # Values are normalized too, so alias resolution is a single
+            # dict get with no re-normalization of the canonical text
+            self._aliases_lower = {
+                k.lower().strip(): v.lower().strip() for k, v in self.aliases.items()
+            }
+        return self
+
 
 class MeasureSpec(BaseModel):
     """Complete measure specification."""
@@ -56,19 +108,79 @@ class MeasureSpec(BaseModel):
     items: list[MeasureItem]
     scales: list[MeasureScale]
 
+    # Lazy ID indexes so per-item lookups in scoring/recoding/validation
+    # are hash lookups instead of list scans
+    _items_by_id: dict[str, MeasureItem] | None = PrivateAttr(default=None)
+    _scales_by_id: dict[str, MeasureScale] | None = PrivateAttr(default=None)
+    _item_ids: frozenset[str] | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _intern_ids(self) -> "MeasureSpec":
+        """Intern the ID vocabulary.
+
+        Measure, item, and scale IDs form a small fixed vocabulary that
+        is copied into every mapped/recoded/scored object; interning
+        lets the hot dict lookups keyed on them compare pointers before
+        characters.
+        """
+        self.measure_id = sys.intern(self.measure_id)
+        for item in self.items:
+            item.item_id = sys.intern(item.item_id)
+        for scale in self.scales:
+            scale.scale_id = sys.intern(scale.scale_id)
+            scale.items = [sys.intern(item_id) for item_id in scale.items]
+            if scale.reversed_items:
+                scale.reversed_items = [sys.intern(i) for i in scale.reversed_items]
+                scale._reversed_set = frozenset(scale.reversed_items)
+        return self
+
+    @model_validator(mode="after")
+    def _stamp_scale_ranges(self) -> "MeasureSpec":
+        """Stamp each scale with the response range of its first item.
+
+        Scales assume all their items share one response range, so the
+        reverse-scoring bounds are fixed at spec load.
+        """
+        for scale in self.scales:
+            if scale.items:
+                item = self.get_item(scale.items[0])
+                if item is not None and item.response_map:
+                    scale._min_value = item._min_value
+                    scale._max_value = item._max_value
+        return self
+
+    @model_validator(mode="after")
+    def _share_response_maps(self) -> "MeasureSpec":
+        """Collapse identical normalized response maps into shared dicts.
+
+        Psychometric measures typically repeat one response set across
+        all items; sharing a single dict keeps one set of buckets
+        resident instead of one per item.
+        """
+        shared: dict[tuple[tuple[str, int], ...], dict[str, int]] = {}
+        for item in self.items:
+            lower = item._response_map_lower
+            if lower:
+                item._response_map_lower = shared.setdefault(tuple(lower.items()), lower)
+        return self
+
     def get_item(self, item_id: str) -> MeasureItem | None:
         """Get an item by its ID."""
-        for item in self.items:
-            if item.item_id == item_id:
-                return item
-        return None
+        if self._items_by_id is None:
+            self._items_by_id = {item.item_id: item for item in self.items}
+        return self._items_by_id.get(item_id)
 
     def get_scale(self, scale_id: str) -> MeasureScale | None:
         """Get a scale by its ID."""
-        for scale in self.scales:
-            if scale.scale_id == scale_id:
-                return scale
-        return None
+        if self._scales_by_id is None:
+            self._scales_by_id = {scale.scale_id: scale for scale in self.scales}
+        return self._scales_by_id.get(scale_id)
+
+    def item_id_set(self) -> frozenset[str]:
+        """All item IDs in this measure, as a cached frozenset."""
+        if self._item_ids is None:
+            self._item_ids = frozenset(item.item_id for item in self.items)
+        return self._item_ids
 
 
 class Binding(BaseModel):
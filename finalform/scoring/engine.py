@@ -6,15 +6,11 @@ No per-questionnaire code is allowed.
 
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 
-from finalform.recoding.recoder import RecodedSection
+from finalform.recoding.recoder import RecodedSection, value_type_of
 from finalform.registry.models import MeasureSpec
-from finalform.scoring.methods import compute_score, prorate_score
-from finalform.scoring.reverse import (
-    apply_reverse_scoring,
-    get_min_max_values_for_item,
-)
+from finalform.scoring.methods import PRORATE_DISPATCH, SCORE_DISPATCH
 
 
 class ScoringError(Exception):
@@ -36,6 +32,14 @@ class ScaleScore(BaseModel):
     reversed_items: list[str]
     prorated: bool = False
     error: str | None = None
+    value_type: Literal["integer", "float", "string", "null"] | None = None
+
+    @model_validator(mode="after")
+    def _derive_value_type(self) -> "ScaleScore":
+        """Classify the score value once at construction time."""
+        if self.value_type is None:
+            self.value_type = value_type_of(self.value)
+        return self
 
 
 class ScoringResult(BaseModel):
@@ -84,18 +88,54 @@ class ScoringEngine:
         for item in section.items:
             item_values[item.item_id] = item.value
 
-        # Score each scale
-        scale_scores: list[ScaleScore] = []
-        for scale in measure.scales:
-            score = self._score_scale(scale, item_values, measure)
-            scale_scores.append(score)
+        # Score each scale; the comprehension presizes the result list
+        score_scale = self._score_scale
+        scale_scores = [score_scale(scale, item_values, measure) for scale in measure.scales]
 
-        return ScoringResult(
+        return ScoringResult.model_construct(
             measure_id=section.measure_id,
             measure_version=section.measure_version,
             scales=scale_scores,
         )
 
+    def score_batch(
+        self,
+        sections: list[RecodedSection],
+        measure: MeasureSpec,
+    ) -> list[ScoringResult]:
+        """Score many recoded sections of the same measure.
+
+        Equivalent to calling score() per section, with per-measure
+        setup (scale list, method binding) hoisted out of the
+        per-submission loop. Batch scoring workloads should prefer this
+        entry point; a vectorized backend can slot in behind the same
+        signature.
+
+        Args:
+            sections: Recoded sections, all for the given measure.
+            measure: The shared measure specification.
+
+        Returns:
+            One ScoringResult per section, in input order.
+        """
+        score_scale = self._score_scale
+        scales = measure.scales
+        construct = ScoringResult.model_construct
+
+        results: list[ScoringResult] = []
+        for section in sections:
+            item_values: dict[str, int | float | None] = {
+                item.item_id: item.value for item in section.items
+            }
+            results.append(
+                construct(
+                    measure_id=section.measure_id,
+                    measure_version=section.measure_version,
+                    scales=[score_scale(scale, item_values, measure) for scale in scales],
+                )
+            )
+        return results
+
     def _score_scale(
         self,
         scale,
@@ -103,8 +143,11 @@ class ScoringEngine:
         measure: MeasureSpec,
     ) -> ScaleScore:
         """Score a single scale."""
-        # Collect values for items in this scale
-        values: dict[str, int | float] = {}
+        # Collect values for items in this scale in one pass, keeping
+        # scale order; present_ids stays parallel to value_list so
+        # reverse scoring doesn't need a dict rebuild
+        value_list: list[int | float] = []
+        present_ids: list[str] = []
         missing_items: list[str] = []
 
         for item_id in scale.items:
@@ -112,44 +155,47 @@ class ScoringEngine:
             if value is None:
                 missing_items.append(item_id)
             else:
-                values[item_id] = value
+                value_list.append(value)
+                present_ids.append(item_id)
 
         # Check if too many items are missing
         if len(missing_items) > scale.missing_allowed:
             strategy = getattr(scale, "missing_strategy", "fail")
             if strategy == "skip":
                 # Skip silently - return null score with no error
-                return ScaleScore(
+                return ScaleScore.model_construct(
                     scale_id=scale.scale_id,
                     name=scale.name,
                     value=None,
                     method=scale.method,
-                    items_used=len(values),
+                    items_used=len(value_list),
                     items_total=len(scale.items),
                     missing_items=missing_items,
                     reversed_items=scale.reversed_items,
                     prorated=False,
                     error=None,
+                    value_type="null",
                 )
             else:
                 # "fail" or "prorate" - report the error
-                return ScaleScore(
+                return ScaleScore.model_construct(
                     scale_id=scale.scale_id,
                     name=scale.name,
                     value=None,
                     method=scale.method,
-                    items_used=len(values),
+                    items_used=len(value_list),
                     items_total=len(scale.items),
                     missing_items=missing_items,
                     reversed_items=scale.reversed_items,
                     prorated=False,
                     error=f"Too many missing items: {len(missing_items)} missing, "
                     f"{scale.missing_allowed} allowed",
+                    value_type="null",
                 )
 
         # If no values at all, can't score
-        if not values:
-            return ScaleScore(
+        if not value_list:
+            return ScaleScore.model_construct(
                 scale_id=scale.scale_id,
                 name=scale.name,
                 value=None,
@@ -160,43 +206,48 @@ class ScoringEngine:
                 reversed_items=scale.reversed_items,
                 prorated=False,
                 error="No values available for scoring",
+                value_type="null",
             )
 
-        # Apply reverse scoring if needed
-        if scale.reversed_items:
-            # Get min and max values from first item's response map
-            # (assuming all items in scale have same response range)
-            first_item_id = scale.items[0]
-            first_item_spec = measure.get_item(first_item_id)
-            if first_item_spec:
-                min_value, max_value = get_min_max_values_for_item(
-                    first_item_spec.response_map
-                )
-                values = apply_reverse_scoring(
-                    values, scale.reversed_items, min_value, max_value
-                )
-
-        # Get list of values in scale order
-        value_list = [values[item_id] for item_id in scale.items if item_id in values]
+        # Apply reverse scoring if needed; the reversed-item set and
+        # response range are precomputed at spec load (range is None if
+        # the first item wasn't resolvable, matching the old skip)
+        if scale.reversed_items and scale._max_value is not None:
+            reversed_set = scale._reversed_set
+            total = scale._max_value + scale._min_value
+            value_list = [
+                total - value if item_id in reversed_set else value
+                for item_id, value in zip(present_ids, value_list)
+            ]
+
+        # Compute score via kernels resolved once per scale (value_list
+        # is known non-empty and the method is Literal-validated, so no
+        # per-call guards are needed)
+        score_fn = scale._score_fn
+        if score_fn is None:
+            score_fn = scale._score_fn = SCORE_DISPATCH[scale.method]
+            scale._prorate_fn = PRORATE_DISPATCH[scale.method]
 
-        # Compute score
         prorated = len(missing_items) > 0
         if prorated:
-            score_value = prorate_score(value_list, scale.method, len(scale.items))
+            score_value = scale._prorate_fn(value_list, len(scale.items))
         else:
-            score_value = compute_score(value_list, scale.method)
+            score_value = score_fn(value_list)
 
-        return ScaleScore(
+        # model_construct skips validation; value_type is set explicitly
+        # since the post-validator won't run
+        return ScaleScore.model_construct(
             scale_id=scale.scale_id,
             name=scale.name,
             value=score_value,
             method=scale.method,
-            items_used=len(values),
+            items_used=len(value_list),
             items_total=len(scale.items),
             missing_items=missing_items,
             reversed_items=scale.reversed_items,
             prorated=prorated,
             error=None,
+            value_type=value_type_of(score_value),
         )
 
     def score_scale(
@@ -6,6 +6,45 @@ Supports sum, average, and sum_then_double methods.
 from typing import Literal
 
 
+def _score_sum(values: list[int | float]) -> float:
+    return float(sum(values))
+
+
+def _score_average(values: list[int | float]) -> float:
+    return sum(values) / len(values)
+
+
+def _score_sum_then_double(values: list[int | float]) -> float:
+    return float(sum(values) * 2)
+
+
+def _prorate_sum(values: list[int | float], total_items: int) -> float:
+    return sum(values) * (total_items / len(values))
+
+
+def _prorate_average(values: list[int | float], total_items: int) -> float:
+    return sum(values) / len(values)
+
+
+def _prorate_sum_then_double(values: list[int | float], total_items: int) -> float:
+    return sum(values) * (total_items / len(values)) * 2
+
+
+# Dispatch tables so hot scoring paths resolve the method once instead
+# of string-comparing per call
+SCORE_DISPATCH = {
+    "sum": _score_sum,
+    "average": _score_average,
+    "sum_then_double": _score_sum_then_double,
+}
+
+PRORATE_DISPATCH = {
+    "sum": _prorate_sum,
+    "average": _prorate_average,
+    "sum_then_double": _prorate_sum_then_double,
+}
+
+
 def compute_score(
     values: list[int | float],
     method: Literal["sum", "average", "sum_then_double"],
@@ -25,17 +64,10 @@ def compute_score(
     if not values:
         raise ValueError("Cannot compute score from empty values list")
 
-    if method == "sum":
-        return float(sum(values))
-
-    elif method == "average":
-        return sum(values) / len(values)
-
-    elif method == "sum_then_double":
-        return float(sum(values) * 2)
-
-    else:
+    score_fn = SCORE_DISPATCH.get(method)
+    if score_fn is None:
         raise ValueError(f"Unknown scoring method: {method}")
+    return score_fn(values)
 
 
 def prorate_score(
@@ -59,20 +91,7 @@ def prorate_score(
     if not values:
         raise ValueError("Cannot compute prorated score from empty values list")
 
-    if method == "average":
-        # Average doesn't need prorating - just compute mean of available values
-        return sum(values) / len(values)
-
-    # For sum-based methods, scale up proportionally
-    available_items = len(values)
-    proportion = total_items / available_items
-    raw_score = sum(values)
-
-    if method == "sum":
-        return raw_score * proportion
-
-    elif method == "sum_then_double":
-        return raw_score * proportion * 2
-
-    else:
+    prorate_fn = PRORATE_DISPATCH.get(method)
+    if prorate_fn is None:
         raise ValueError(f"Unknown scoring method: {method}")
+    return prorate_fn(values, total_items)
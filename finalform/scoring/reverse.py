@@ -3,6 +3,20 @@
 Applies reverse scoring to specified items by computing (max_value + min_value - value).
 """
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=512)
+def _min_max_cached(items: tuple[tuple[str, int], ...]) -> tuple[int, int]:
+    """Min/max scan memoized by the response map's items.
+
+    Response maps are typically shared verbatim across the items of a
+    scale, so the scan runs once per distinct map rather than once per
+    item.
+    """
+    values = [value for _, value in items]
+    return min(values), max(values)
+
 
 def apply_reverse_scoring(
     values: dict[str, int | float],
@@ -25,14 +39,14 @@ def apply_reverse_scoring(
     Returns:
         Dictionary with reverse scoring applied to specified items.
     """
-    result = dict(values)
-
-    for item_id in reversed_items:
-        if item_id in result and result[item_id] is not None:
-            original = result[item_id]
-            result[item_id] = (max_value + min_value) - original
-
-    return result
+    # Build the result in one comprehension pass instead of copying the
+    # dict and re-probing it per reversed item
+    reversed_set = set(reversed_items)
+    total = max_value + min_value
+    return {
+        item_id: total - value if item_id in reversed_set and value is not None else value
+        for item_id, value in values.items()
+    }
 
 
 def get_min_max_values_for_item(response_map: dict[str, int]) -> tuple[int, int]:
@@ -44,8 +58,7 @@ def get_min_max_values_for_item(response_map: dict[str, int]) -> tuple[int, int]
     Returns:
         Tuple of (min_value, max_value).
     """
-    values = response_map.values()
-    return min(values), max(values)
+    return _min_max_cached(tuple(response_map.items()))
 
 
 def get_max_value_for_item(response_map: dict[str, int]) -> int:
@@ -61,4 +74,4 @@ def get_max_value_for_item(response_map: dict[str, int]) -> int:
         This function is deprecated. Use get_min_max_values_for_item instead
         to get both min and max for proper reverse scoring.
     """
-    return max(response_map.values())
+    return _min_max_cached(tuple(response_map.items()))[1]
@@ -54,50 +54,50 @@ class Validator:
             ValidationResult with validation status and details.
         """
         errors: list[str] = []
-        missing_items: list[str] = []
         out_of_range_items: list[str] = []
+        seen_ids: set[str] = set()
+        missing_set: set[str] = set()
 
-        # Build set of item IDs in the recoded section
-        recoded_item_ids = {item.item_id for item in section.items}
-
-        # Build set of expected item IDs from measure
-        expected_item_ids = {item.item_id for item in measure.items}
-
-        # Check for missing items (in measure but not in recoded)
-        for item_id in expected_item_ids:
-            if item_id not in recoded_item_ids:
-                missing_items.append(item_id)
-
-        # Check for items marked as missing
+        # Single pass over the section: track seen IDs, flagged-missing
+        # items, and range errors together
         for item in section.items:
+            item_id = item.item_id
+            seen_ids.add(item_id)
+
             if item.missing:
-                if item.item_id not in missing_items:
-                    missing_items.append(item.item_id)
+                missing_set.add(item_id)
+                continue
+            if item.value is None:
+                continue
 
-        # Validate each item
-        for item in section.items:
-            if item.missing or item.value is None:
+            # Values the recoder already checked against the response
+            # map are in range by construction
+            if item.validated:
                 continue
 
             # Get item spec for range validation
-            item_spec = measure.get_item(item.item_id)
+            item_spec = measure.get_item(item_id)
             if item_spec is None:
-                errors.append(f"Unknown item: {item.item_id}")
+                errors.append(f"Unknown item: {item_id}")
                 continue
 
-            # Get valid range from response_map
-            valid_values = list(item_spec.response_map.values())
-            min_val = min(valid_values)
-            max_val = max(valid_values)
+            # Range bounds are precomputed at spec load
+            min_val = item_spec._min_value
+            max_val = item_spec._max_value
 
             # Check if value is in valid range
             if not (min_val <= item.value <= max_val):
-                out_of_range_items.append(item.item_id)
+                out_of_range_items.append(item_id)
                 errors.append(
-                    f"Item {item.item_id}: value {item.value} "
+                    f"Item {item_id}: value {item.value} "
                     f"out of range [{min_val}, {max_val}]"
                 )
 
+        # Items in the measure but absent from the section are missing too
+        expected_item_ids = measure.item_id_set()
+        missing_set |= expected_item_ids - seen_ids
+        missing_items = sorted(missing_set) if missing_set else []
+
         # Calculate completeness
         total_items = len(expected_item_ids)
         present_items = total_items - len(missing_items)
@@ -107,12 +107,12 @@ class Validator:
         # Valid if no errors, no out-of-range, and completeness is acceptable
         valid = len(errors) == 0 and len(out_of_range_items) == 0
 
-        return ValidationResult(
+        return ValidationResult.model_construct(
             measure_id=section.measure_id,
             valid=valid,
             completeness=completeness,
-            missing_items=sorted(missing_items),
-            out_of_range_items=sorted(out_of_range_items),
+            missing_items=missing_items,
+            out_of_range_items=sorted(out_of_range_items) if out_of_range_items else [],
             errors=errors,
         )
 
@@ -136,7 +136,7 @@ class Validator:
         """
         scale = measure.get_scale(scale_id)
         if scale is None:
-            return ValidationResult(
+            return ValidationResult.model_construct(
                 measure_id=section.measure_id,
                 valid=False,
                 completeness=0.0,
@@ -149,8 +149,8 @@ class Validator:
         missing_items: list[str] = []
         out_of_range_items: list[str] = []
 
-        # Build lookup for recoded items
-        recoded_items_by_id = {item.item_id: item for item in section.items}
+        # Recoded item index is memoized on the section
+        recoded_items_by_id = section.items_by_id()
 
         # Check each item in the scale
         for item_id in scale.items:
@@ -164,16 +164,19 @@ class Validator:
                 missing_items.append(item_id)
                 continue
 
+            # Recoder-checked values are in range by construction
+            if recoded_item.validated:
+                continue
+
             # Get item spec for range validation
             item_spec = measure.get_item(item_id)
             if item_spec is None:
                 errors.append(f"Unknown item in scale: {item_id}")
                 continue
 
-            # Check range
-            valid_values = list(item_spec.response_map.values())
-            min_val = min(valid_values)
-            max_val = max(valid_values)
+            # Check range (bounds precomputed at spec load)
+            min_val = item_spec._min_value
+            max_val = item_spec._max_value
 
             if not (min_val <= recoded_item.value <= max_val):
                 out_of_range_items.append(item_id)
@@ -203,11 +206,11 @@ class Validator:
                 f"{len(missing_items)} missing, {missing_allowed} allowed"
             )
 
-        return ValidationResult(
+        return ValidationResult.model_construct(
             measure_id=section.measure_id,
             valid=valid,
             completeness=completeness,
-            missing_items=sorted(missing_items),
-            out_of_range_items=sorted(out_of_range_items),
+            missing_items=sorted(missing_items) if missing_items else [],
+            out_of_range_items=sorted(out_of_range_items) if out_of_range_items else [],
             errors=errors,
         )
@@ -256,3 +256,45 @@ class TestExecuteImport:
 
         assert exec_fn is not None
         assert callable(exec_fn)
+
+
+class TestPipelineCache:
+    """Tests for the per-configuration Pipeline cache."""
+
+    def test_repeated_calls_reuse_pipeline(
+        self,
+        measure_registry_path: Path,
+        binding_registry_path: Path,
+    ) -> None:
+        """Test that identical configurations get the same Pipeline."""
+        from finalform.callable.execute import _get_pipeline, clear_pipeline_cache
+
+        clear_pipeline_cache()
+        first = _get_pipeline(
+            str(measure_registry_path),
+            str(binding_registry_path),
+            "example_intake",
+            "1.0.0",
+            False,
+            None,
+        )
+        second = _get_pipeline(
+            str(measure_registry_path),
+            str(binding_registry_path),
+            "example_intake",
+            "1.0.0",
+            False,
+            None,
+        )
+        assert second is first
+
+        clear_pipeline_cache()
+        third = _get_pipeline(
+            str(measure_registry_path),
+            str(binding_registry_path),
+            "example_intake",
+            "1.0.0",
+            False,
+            None,
+        )
+        assert third is not first
@@ -353,6 +353,30 @@ class TestMeasurementEventBuilder:
         assert "measurement_event_id" in json_dict
         assert "observations" in json_dict
 
+    def test_to_json_bytes_matches_model_dump(
+        self,
+        builder: MeasurementEventBuilder,
+        example_binding,
+        phq9_recoded_section,
+        phq9_scoring_result,
+        phq9_interpretation_result,
+    ) -> None:
+        """Test that the hand-written serializer matches model_dump output."""
+        import json
+
+        event = builder.build(
+            recoded_section=phq9_recoded_section,
+            scoring_result=phq9_scoring_result,
+            interpretation_result=phq9_interpretation_result,
+            binding_spec=example_binding,
+            form_id="test",
+            form_submission_id="sub_123",
+            subject_id="contact::abc",
+            timestamp="2025-01-15T10:30:00Z",
+        )
+
+        assert json.loads(event.to_json_bytes()) == event.model_dump(by_alias=True)
+
 
 class TestObservation:
     """Tests for Observation model."""
@@ -285,6 +285,81 @@ class TestDiagnosticsCollector:
         assert result.quality.completeness == pytest.approx(15 / 16)
         assert result.quality.missing_items == ["phq9_item3"]
 
+    def test_finalize_status_matches_finalize(self, collector: DiagnosticsCollector) -> None:
+        """Test that finalize_status agrees with the full report's status."""
+        collector.add_warning(
+            stage="recoding",
+            code="MISSING_VALUE",
+            message="Item phq9_item3 has missing value",
+            measure_id="phq9",
+        )
+
+        assert collector.finalize_status() == ProcessingStatus.PARTIAL
+        assert collector.finalize().status == ProcessingStatus.PARTIAL
+
+    def test_finalize_bytes_matches_finalize(self, collector: DiagnosticsCollector) -> None:
+        """Test that the direct-to-bytes path matches the pydantic report."""
+        import orjson
+
+        collector.add_error(
+            stage="validation",
+            code="VALIDATION_ERROR",
+            message="Item phq9_item1: value 5 out of range [0, 3]",
+            measure_id="phq9",
+        )
+        collector.set_measure_quality(
+            measure_id="phq9",
+            items_total=9,
+            items_present=8,
+            missing_items=["phq9_item3"],
+            out_of_range_items=["phq9_item1"],
+            prorated_scales=[],
+        )
+
+        raw = orjson.loads(collector.finalize_bytes())
+        report = collector.finalize()
+
+        assert raw == report.model_dump(mode="json")
+
+    def test_finalize_is_cached(self, collector: DiagnosticsCollector) -> None:
+        """Test that repeat finalize calls return the same report."""
+        first = collector.finalize()
+        assert collector.finalize() is first
+
+    def test_to_columnar(self, collector: DiagnosticsCollector) -> None:
+        """Test columnar export of per-measure diagnostics."""
+        collector.set_measure_quality(
+            measure_id="phq9",
+            items_total=9,
+            items_present=8,
+            missing_items=["phq9_item3"],
+            out_of_range_items=[],
+            prorated_scales=["phq9_total"],
+        )
+        collector.add_warning(
+            stage="recoding",
+            code="MISSING_VALUE",
+            message="Item phq9_item3 has missing value",
+            measure_id="phq9",
+        )
+        collector.set_measure_quality(
+            measure_id="gad7",
+            items_total=7,
+            items_present=7,
+            missing_items=[],
+            out_of_range_items=[],
+            prorated_scales=[],
+        )
+
+        columns = collector.to_columnar()
+
+        assert columns["measure_ids"] == ["phq9", "gad7"]
+        assert list(columns["statuses"]) == [1, 0]  # partial, success
+        assert list(columns["items_total"]) == [9, 7]
+        assert list(columns["items_present"]) == [8, 7]
+        assert columns["missing_items"] == ["phq9_item3"]
+        assert list(columns["missing_items_offsets"]) == [0, 1, 1]
+
     def test_multiple_instruments(self, collector: DiagnosticsCollector) -> None:
         """Test handling multiple instruments."""
         collector.add_error(
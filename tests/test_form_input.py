@@ -8,6 +8,7 @@ from finalform.input import (
     FormInputClient,
     MissingFormIdError,
     MissingItemMapError,
+    SqliteFormInputClient,
     UnmappedFieldError,
     process_form_submission,
 )
@@ -110,6 +111,27 @@ class TestFormInputClient:
         assert events[0]["form_id"] == "intake_v1"
         assert events[0]["accepted"] is True
 
+    def test_record_resolution_events_batch(self, form_input_client: FormInputClient) -> None:
+        """Test recording a batch of resolution events in one write."""
+        form_input_client.record_resolution_events(
+            [
+                {
+                    "timestamp": "2025-01-15T10:30:00Z",
+                    "form_id": "intake_v1",
+                    "measure_id": "phq9",
+                    "field_id": f"entry.{n}",
+                    "candidate_item_id": f"phq9_item{n}",
+                    "accepted": True,
+                    "reason": None,
+                }
+                for n in range(3)
+            ]
+        )
+
+        events = form_input_client.get_resolution_events()
+        assert len(events) == 3
+        assert [e["field_id"] for e in events] == ["entry.0", "entry.1", "entry.2"]
+
     def test_get_resolution_events_filtered(self, form_input_client: FormInputClient) -> None:
         """Test filtering resolution events."""
         form_input_client.record_resolution_event("form1", "phq9", "f1", "i1", True)
@@ -120,6 +142,90 @@ class TestFormInputClient:
         assert phq9_events[0]["measure_id"] == "phq9"
 
 
+class TestSqliteFormInputClient:
+    """Tests for the SQLite-backed client."""
+
+    @pytest.fixture
+    def sqlite_client(self, tmp_path: Path) -> SqliteFormInputClient:
+        """Create a SqliteFormInputClient with a temp database."""
+        return SqliteFormInputClient(tmp_path / "mappings.db")
+
+    def test_save_and_get_item_map(self, sqlite_client: SqliteFormInputClient) -> None:
+        """Test saving and retrieving an item map."""
+        item_map = {
+            "entry.111111": "phq9_item1",
+            "entry.222222": "phq9_item2",
+        }
+
+        sqlite_client.save_item_map("intake_v1", "phq9", item_map)
+        assert sqlite_client.get_item_map("intake_v1", "phq9") == item_map
+
+    def test_get_nonexistent_returns_none(self, sqlite_client: SqliteFormInputClient) -> None:
+        """Test that getting a nonexistent mapping returns None."""
+        assert sqlite_client.get_item_map("nonexistent_form", "phq9") is None
+
+    def test_save_overwrites_existing(self, sqlite_client: SqliteFormInputClient) -> None:
+        """Test that saving overwrites existing mapping."""
+        sqlite_client.save_item_map("intake_v1", "phq9", {"a": "b"})
+        sqlite_client.save_item_map("intake_v1", "phq9", {"c": "d"})
+
+        assert sqlite_client.get_item_map("intake_v1", "phq9") == {"c": "d"}
+
+    def test_list_and_delete_mappings(self, sqlite_client: SqliteFormInputClient) -> None:
+        """Test listing and deleting mappings."""
+        sqlite_client.save_item_map("intake_v1", "phq9", {"a": "b"})
+        sqlite_client.save_item_map("intake_v1", "gad7", {"c": "d"})
+
+        assert set(sqlite_client.list_mappings("intake_v1")) == {"phq9", "gad7"}
+        assert sqlite_client.delete_item_map("intake_v1", "phq9") is True
+        assert sqlite_client.delete_item_map("intake_v1", "phq9") is False
+        assert sqlite_client.list_mappings("intake_v1") == ["gad7"]
+
+    def test_resolution_events(self, sqlite_client: SqliteFormInputClient) -> None:
+        """Test recording and filtering resolution events."""
+        sqlite_client.record_resolution_event("form1", "phq9", "f1", "i1", True)
+        sqlite_client.record_resolution_event("form2", "gad7", "f2", "i2", False)
+
+        events = sqlite_client.get_resolution_events()
+        assert len(events) == 2
+        assert events[0]["accepted"] is True
+
+        phq9_events = sqlite_client.get_resolution_events(measure_id="phq9")
+        assert len(phq9_events) == 1
+        assert phq9_events[0]["form_id"] == "form1"
+
+    def test_usable_with_process_form_submission(
+        self,
+        sqlite_client: SqliteFormInputClient,
+        measure_registry: MeasureRegistry,
+    ) -> None:
+        """Test that the SQLite client is a drop-in for processing."""
+        sqlite_client.save_item_map(
+            "intake_v1",
+            "phq9",
+            {f"entry.{n}": f"phq9_item{n}" for n in range(1, 11)},
+        )
+
+        form_submission = {
+            "form_id": "intake_v1",
+            "submission_id": "sub_001",
+            "respondent": {"id": "client_123", "display": "Client"},
+            "submitted_at": "2025-01-15T10:30:00Z",
+            "items": [
+                {"field_id": f"entry.{n}", "question_text": None, "raw_value": "1"}
+                for n in range(1, 11)
+            ],
+        }
+
+        result = process_form_submission(
+            form_submission,
+            measure_id="phq9",
+            form_input_client=sqlite_client,
+            measure_registry=measure_registry,
+        )
+        assert result.success
+
+
 class TestProcessFormSubmission:
     """Tests for process_form_submission."""
 
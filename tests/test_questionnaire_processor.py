@@ -171,6 +171,87 @@ class TestQuestionnaireProcessor:
             assert e1.measurement_event_id == e2.measurement_event_id
 
 
+class TestProcessBatch:
+    """Tests for batch processing."""
+
+    def test_process_batch_matches_per_call(
+        self,
+        processor: QuestionnaireProcessor,
+        complete_form_response: dict,
+        binding_spec,
+        measures: dict,
+    ) -> None:
+        """Test that batch results match individual process() calls."""
+        second = dict(complete_form_response, form_submission_id="sub_67890")
+
+        results = processor.process_batch(
+            [complete_form_response, second],
+            binding_spec=binding_spec,
+            measures=measures,
+            deterministic_ids=True,
+        )
+
+        assert [r.form_submission_id for r in results] == ["sub_12345", "sub_67890"]
+        assert all(r.success for r in results)
+        direct = processor.process(
+            form_response=complete_form_response,
+            binding_spec=binding_spec,
+            measures=measures,
+            deterministic_ids=True,
+        )
+        assert [e.measurement_event_id for e in results[0].events] == [
+            e.measurement_event_id for e in direct.events
+        ]
+
+
+class TestCompiledProcessor:
+    """Tests for the compiled (spec-bound) processor."""
+
+    def test_compile_matches_process(
+        self,
+        processor: QuestionnaireProcessor,
+        complete_form_response: dict,
+        binding_spec,
+        measures: dict,
+    ) -> None:
+        """Test that the compiled processor matches the generic path."""
+        compiled = processor.compile(binding_spec, measures)
+
+        direct = processor.process(
+            form_response=complete_form_response,
+            binding_spec=binding_spec,
+            measures=measures,
+            deterministic_ids=True,
+        )
+        bound = compiled.process(complete_form_response, deterministic_ids=True)
+
+        assert bound.success is direct.success
+        assert [e.measurement_event_id for e in bound.events] == [
+            e.measurement_event_id for e in direct.events
+        ]
+
+    def test_compile_rejects_invalid_measures(
+        self,
+        processor: QuestionnaireProcessor,
+        binding_spec,
+    ) -> None:
+        """Test that compile surfaces spec errors immediately."""
+        from finalform.registry.models import MeasureSpec
+
+        bad_measure = MeasureSpec(
+            type="measure_spec",
+            measure_id="test",
+            version="1.0.0",
+            name="Test",
+            kind="lab_panel",  # Wrong kind for questionnaire domain
+            items=[],
+            scales=[],
+        )
+
+        with pytest.raises(ValueError, match="Invalid measure spec"):
+            processor.compile(binding_spec, {"test": bad_measure})
+
+
 class TestValidateMeasure:
     """Tests for measure validation."""
 
@@ -318,6 +318,35 @@ class TestScoringEngine:
         assert score is None
 
 
+class TestScoreBatch:
+    """Tests for ScoringEngine.score_batch."""
+
+    def test_score_batch_matches_per_call(self, engine: ScoringEngine, phq9_spec) -> None:
+        """Test that batch scoring matches per-section scoring."""
+        sections = [
+            RecodedSection(
+                measure_id="phq9",
+                measure_version="1.0.0",
+                items=[
+                    RecodedItem(
+                        measure_id="phq9",
+                        measure_version="1.0.0",
+                        item_id=f"phq9_item{i}",
+                        value=value,
+                        raw_answer=str(value),
+                    )
+                    for i in range(1, 11)
+                ],
+            )
+            for value in (0, 1, 3)
+        ]
+
+        batch = engine.score_batch(sections, phq9_spec)
+        singles = [engine.score(section, phq9_spec) for section in sections]
+
+        assert [r.model_dump() for r in batch] == [r.model_dump() for r in singles]
+
+
 class TestScaleScore:
     """Tests for ScaleScore model."""
 